@@ -1,12 +1,11 @@
 """REST API Wrapper für CompText MCP Server"""
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
 import uvicorn
 import logging
 import os
 import sys
+from typing import Optional
 from dotenv import load_dotenv
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -25,6 +24,8 @@ from comptext_mcp.notion_client import (
     get_page_by_id,
     get_modules_by_tag,
     get_modules_by_type,
+    get_modules_multi,
+    get_statistics as get_codex_statistics,
     NotionClientError,
     clear_cache
 )
@@ -84,7 +85,7 @@ async def root(request: Request):
 @track_performance("health")
 async def health_check(request: Request):
     try:
-        modules = get_all_modules()
+        modules = await get_all_modules()
         return {
             "status": "healthy",
             "notion_connected": True,
@@ -103,7 +104,7 @@ async def health_check(request: Request):
 @track_performance("list_modules")
 async def list_modules(request: Request):
     try:
-        modules = get_all_modules()
+        modules = await get_all_modules()
         by_module = {}
         for entry in modules:
             modul = entry.get("modul")
@@ -135,7 +136,7 @@ async def get_module(request: Request, module: str):
         if module in MODULE_MAP:
             module = MODULE_MAP[module]
         
-        entries = get_module_by_name(module)
+        entries = await get_module_by_name(module)
         return {
             "module": module,
             "count": len(entries),
@@ -154,7 +155,7 @@ async def search(
 ):
     try:
         validated_query = validate_query_string(query)
-        results = search_codex(validated_query, max_results)
+        results = await search_codex(validated_query, max_results)
         return {
             "query": validated_query,
             "count": len(results),
@@ -171,8 +172,8 @@ async def search(
 async def get_command(request: Request, page_id: str):
     try:
         validated_id = validate_page_id(page_id)
-        page_info = get_page_by_id(validated_id)
-        content = get_page_content(validated_id)
+        page_info = await get_page_by_id(validated_id)
+        content = await get_page_content(validated_id)
         
         return {
             "page_info": page_info,
@@ -188,7 +189,7 @@ async def get_command(request: Request, page_id: str):
 @limiter.limit("30/minute")
 async def get_by_tag(request: Request, tag: str):
     try:
-        results = get_modules_by_tag(tag)
+        results = await get_modules_by_tag(tag)
         return {
             "tag": tag,
             "count": len(results),
@@ -202,7 +203,7 @@ async def get_by_tag(request: Request, tag: str):
 @limiter.limit("30/minute")
 async def get_by_type(request: Request, typ: str):
     try:
-        results = get_modules_by_type(typ)
+        results = await get_modules_by_type(typ)
         return {
             "type": typ,
             "count": len(results),
@@ -212,37 +213,39 @@ async def get_by_type(request: Request, typ: str):
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@app.get("/api/statistics")
+@app.get("/api/entries")
 @limiter.limit("30/minute")
-async def get_statistics(request: Request):
+async def get_entries(
+    request: Request,
+    module: Optional[str] = Query(None, description="Modulname oder Buchstabe"),
+    tag: Optional[str] = Query(None, description="Tag"),
+    typ: Optional[str] = Query(None, alias="type", description="Typ"),
+):
+    if module is None and tag is None and typ is None:
+        raise HTTPException(status_code=400, detail="Provide at least one of module, tag or type")
     try:
-        modules = get_all_modules()
-        by_module = {}
-        by_type = {}
-        by_tag = {}
-        
-        for entry in modules:
-            modul = entry.get("modul")
-            if modul:
-                by_module[modul] = by_module.get(modul, 0) + 1
-            
-            typ = entry.get("typ")
-            if typ:
-                by_type[typ] = by_type.get(typ, 0) + 1
-            
-            for tag in entry.get("tags", []):
-                by_tag[tag] = by_tag.get(tag, 0) + 1
-        
+        module = MODULE_MAP.get(module, module)
+        results = await get_modules_multi(modul=module, tag=tag, typ=typ)
         return {
-            "total_entries": len(modules),
-            "by_module": by_module,
-            "by_type": by_type,
-            "by_tag": by_tag
+            "module": module,
+            "tag": tag,
+            "type": typ,
+            "count": len(results),
+            "entries": results
         }
     except NotionClientError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
+@app.get("/api/statistics")
+@limiter.limit("30/minute")
+async def get_statistics(request: Request):
+    try:
+        return await get_codex_statistics()
+    except NotionClientError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
 @app.post("/api/cache/clear")
 @limiter.limit("5/minute")
 async def clear_cache_endpoint(request: Request):
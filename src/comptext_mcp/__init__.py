@@ -3,11 +3,44 @@
 __version__ = "1.0.0"
 __author__ = "CompText Team"
 
-from .server import server, main
-from .notion_client import get_all_modules as notion_get_all_modules, get_module_by_name as notion_get_module_by_name, get_page_content as notion_get_page_content, search_codex as notion_search_codex, NotionClientError
-from .local_codex_client import get_all_modules as local_get_all_modules, get_module_by_name as local_get_module_by_name, get_page_content as local_get_page_content, search_codex as local_search_codex, LocalCodexClientError
+from importlib import import_module
+
 from .constants import MODULE_MAP
 
+# Exports resolved on first access, so importing a submodule (the REST wrapper's
+# notion_client, the mobile agent CLI, `python -m comptext_mcp.server`) does not
+# also load the MCP server, both codex clients and PyGithub
+_LAZY_EXPORTS = {
+    "server": (".server", "server"),
+    "main": (".server", "main"),
+    "notion_get_all_modules": (".notion_client", "get_all_modules"),
+    "notion_get_module_by_name": (".notion_client", "get_module_by_name"),
+    "notion_get_page_content": (".notion_client", "get_page_content"),
+    "notion_search_codex": (".notion_client", "search_codex"),
+    "NotionClientError": (".notion_client", "NotionClientError"),
+    "local_get_all_modules": (".local_codex_client", "get_all_modules"),
+    "local_get_module_by_name": (".local_codex_client", "get_module_by_name"),
+    "local_get_page_content": (".local_codex_client", "get_page_content"),
+    "local_search_codex": (".local_codex_client", "search_codex"),
+    "LocalCodexClientError": (".local_codex_client", "LocalCodexClientError"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = import_module(module_name, __name__)
+    if module_name == ".server":
+        # Importing the submodule binds it as "server"; rebind the Server instance
+        globals()["server"] = module.server
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "server",
     "main",
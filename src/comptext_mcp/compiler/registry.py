@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class Profile:
@@ -36,7 +39,7 @@ def _repo_root() -> Path:
 
 def load_registry(path: Optional[str] = None) -> Registry:
     yaml_path = Path(path) if path else (_repo_root() / "bundles" / "bundles.yaml")
-    data = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+    data = yaml.load(yaml_path.read_text(encoding="utf-8"), Loader=_SafeLoader)
 
     profiles: Dict[str, Profile] = {}
     for p in data.get("profiles", []):
@@ -20,13 +20,21 @@ MODULE_MAP = {
 # API Configuration
 DEFAULT_MAX_RESULTS = 20
 MAX_SEARCH_RESULTS = 100
+MAX_BATCH_CALLS = 20  # Sub-calls accepted by one batch_execute call
+MAX_CONCURRENT_BATCH_CALLS = 4  # Sub-calls of a batch running at the same time
 
 # Cache Configuration
 CACHE_SIZE = 128
 CACHE_TTL = 3600  # 1 hour in seconds
+PARSED_PAGE_CACHE_SIZE = 4096  # Parsed Notion pages kept by parse_page
+QUERY_CACHE_SIZE = 64  # Distinct arguments cached per filtered Notion query
+QUERY_CACHE_TTL = 300  # 5 minutes in seconds
 
 # Notion API Configuration
 DEFAULT_DATABASE_ID = "0e038c9b52c5466694dbac288280dd93"
+NOTION_PAGE_SIZE = 100  # Largest page_size accepted by databases.query
+NOTION_MAX_CONNECTIONS = 32
+NOTION_MAX_KEEPALIVE_CONNECTIONS = 16
 
 # Local Codex Configuration
 DEFAULT_DATA_PATH = "data/codex.json"
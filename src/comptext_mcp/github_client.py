@@ -2,12 +2,9 @@
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any
 from github import Github, GithubException
 from github.Repository import Repository
-from github.PullRequest import PullRequest
-from github.Branch import Branch
 
 logger = logging.getLogger(__name__)
 
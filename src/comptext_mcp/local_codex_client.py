@@ -4,11 +4,11 @@ import json
 import logging
 import os
 from functools import lru_cache
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
 
 from .constants import CACHE_SIZE, DEFAULT_DATA_PATH
-from .utils import validate_page_id, validate_query_string, sanitize_text_output
+from .utils import compute_statistics, validate_query_string, sanitize_text_output
 
 # Logging Setup
 logger = logging.getLogger(__name__)
@@ -65,6 +65,23 @@ def _get_cached_codex() -> Dict[str, Any]:
     return _load_codex_data()
 
 
+@lru_cache(maxsize=1)
+def _get_modules_by_id() -> Dict[str, Dict[str, Any]]:
+    """
+    Index the raw codex modules by ID.
+    
+    Built once per codex load so ID lookups skip the linear scan. The first
+    module wins if an ID is duplicated.
+    
+    Returns:
+        Dictionary mapping module ID to raw module entry
+    """
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for module in _get_cached_codex().get("modules", []):
+        by_id.setdefault(module.get("id"), module)
+    return by_id
+
+
 def parse_module(module: Dict) -> Dict[str, Any]:
     """
     Parse module entry to standardized format.
@@ -105,10 +122,14 @@ def get_all_modules() -> List[Dict[str, Any]]:
     return [parse_module(m) for m in modules]
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def get_module_by_name(modul_name: str) -> List[Dict[str, Any]]:
     """
     Load all entries of a specific module.
     
+    Results are cached per argument until clear_cache(); callers must not
+    mutate the returned list.
+    
     Args:
         modul_name: Full module name (e.g., "Modul B: Programmierung")
         
@@ -139,15 +160,12 @@ def get_page_content(page_id: str) -> str:
     if not page_id:
         raise ValueError("Page ID cannot be empty")
     
-    codex = _get_cached_codex()
-    modules = codex.get("modules", [])
-    
-    for module in modules:
-        if module.get("id") == page_id:
-            content = module.get("content", "")
-            return sanitize_text_output(content)
+    module = _get_modules_by_id().get(page_id)
+    if module is None:
+        raise LocalCodexClientError(f"Module not found: {page_id}")
     
-    raise LocalCodexClientError(f"Module not found: {page_id}")
+    content = module.get("content", "")
+    return sanitize_text_output(content)
 
 
 def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
@@ -166,16 +184,13 @@ def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
         LocalCodexClientError: If loading fails
     """
     validated_query = validate_query_string(query)
-    all_modules = get_all_modules()
+    if max_results <= 0:
+        return []
     query_lower = validated_query.lower()
     
     results = []
-    for module in all_modules:
-        titel = (module.get("titel") or "").lower()
-        beschreibung = (module.get("beschreibung") or "").lower()
-        tags = " ".join(module.get("tags", [])).lower()
-        
-        if query_lower in titel or query_lower in beschreibung or query_lower in tags:
+    for haystack, module in _get_search_index():
+        if query_lower in haystack:
             results.append(module)
             
             if len(results) >= max_results:
@@ -184,6 +199,31 @@ def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
     return results
 
 
+@lru_cache(maxsize=1)
+def _get_search_index() -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Pair every parsed module with its lowercased search haystack.
+    
+    The haystack joins title, description and tags with NUL separators so a
+    match cannot span two fields. Built once per codex load; clear_cache()
+    rebuilds it.
+    
+    Returns:
+        List of (haystack, module) tuples in codex order
+    """
+    index = []
+    for module in get_all_modules():
+        haystack = "\0".join(
+            (
+                (module.get("titel") or "").lower(),
+                (module.get("beschreibung") or "").lower(),
+                " ".join(module.get("tags") or ()).lower(),
+            )
+        )
+        index.append((haystack, module))
+    return index
+
+
 def get_page_by_id(page_id: str) -> Dict[str, Any]:
     """
     Get module information by ID.
@@ -201,19 +241,21 @@ def get_page_by_id(page_id: str) -> Dict[str, Any]:
     if not page_id:
         raise ValueError("Page ID cannot be empty")
     
-    all_modules = get_all_modules()
-    
-    for module in all_modules:
-        if module.get("id") == page_id:
-            return module
+    module = _get_modules_by_id().get(page_id)
+    if module is None:
+        raise LocalCodexClientError(f"Module not found: {page_id}")
     
-    raise LocalCodexClientError(f"Module not found: {page_id}")
+    return parse_module(module)
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def get_modules_by_tag(tag: str) -> List[Dict[str, Any]]:
     """
     Filter modules by tag.
     
+    Results are cached per argument until clear_cache(); callers must not
+    mutate the returned list.
+    
     Args:
         tag: Tag name to filter by (e.g., "Core", "Erweitert")
         
@@ -227,10 +269,14 @@ def get_modules_by_tag(tag: str) -> List[Dict[str, Any]]:
     return [m for m in all_modules if tag in m.get("tags", [])]
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def get_modules_by_type(typ: str) -> List[Dict[str, Any]]:
     """
     Filter modules by type.
     
+    Results are cached per argument until clear_cache(); callers must not
+    mutate the returned list.
+    
     Args:
         typ: Type to filter by (e.g., "Dokumentation", "Beispiel")
         
@@ -244,6 +290,32 @@ def get_modules_by_type(typ: str) -> List[Dict[str, Any]]:
     return [m for m in all_modules if m.get("typ") == typ]
 
 
+@lru_cache(maxsize=1)
+def _get_cached_statistics() -> Dict[str, Any]:
+    """
+    Get statistics of the cached codex data.
+    
+    Computed once per codex load; clear_cache() invalidates them.
+    
+    Returns:
+        Dictionary with total_entries and by_module/by_type/by_tag counts
+    """
+    return compute_statistics(get_all_modules())
+
+
+def get_statistics() -> Dict[str, Any]:
+    """
+    Count codex entries by module, type and tag.
+    
+    Returns:
+        Dictionary with total_entries and by_module/by_type/by_tag counts
+        
+    Raises:
+        LocalCodexClientError: If loading fails
+    """
+    return _get_cached_statistics()
+
+
 def clear_cache():
     """
     Clear the cache for codex data.
@@ -251,4 +323,10 @@ def clear_cache():
     Use this to force a reload of data from the JSON file.
     """
     _get_cached_codex.cache_clear()
+    _get_modules_by_id.cache_clear()
+    _get_search_index.cache_clear()
+    _get_cached_statistics.cache_clear()
+    get_module_by_name.cache_clear()
+    get_modules_by_tag.cache_clear()
+    get_modules_by_type.cache_clear()
     logger.info("Cache cleared")
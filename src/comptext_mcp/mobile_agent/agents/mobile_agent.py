@@ -14,9 +14,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
-from ..config import MobileAgentConfig, AgentMode
-from ..ollama_client import OllamaCloudClient, ChatMessage, ChatResponse
-from ..droidrun_wrapper import DroidRunWrapper, ScreenState, ActionResult, ActionType, UIElement
+from ..config import MobileAgentConfig
+from ..ollama_client import OllamaCloudClient, ChatMessage
+from ..droidrun_wrapper import DroidRunWrapper, ScreenState, ActionResult, ActionType
 
 logger = logging.getLogger(__name__)
 
@@ -513,7 +513,7 @@ def serve(ctx, host: str, port: int):
         {"command": "stop"}
     """
     try:
-        from .websocket_server import run_websocket_server
+        from .websocket_server import run_event_loop, run_websocket_server
     except ImportError:
         click.echo(click.style(
             "WebSocket support not available. Install with: pip install websockets",
@@ -532,7 +532,7 @@ def serve(ctx, host: str, port: int):
     click.echo("Press Ctrl+C to stop\n")
 
     try:
-        asyncio.run(run_websocket_server(host, port, config))
+        run_event_loop(run_websocket_server(host, port, config))
     except KeyboardInterrupt:
         click.echo("\nServer stopped")
 
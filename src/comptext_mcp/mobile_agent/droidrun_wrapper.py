@@ -7,11 +7,9 @@ Includes ADB integration, UI tree parsing, and action execution.
 
 import asyncio
 import base64
-import json
 import logging
 import os
 import subprocess
-import tempfile
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from enum import Enum
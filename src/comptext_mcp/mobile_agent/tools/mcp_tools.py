@@ -5,14 +5,12 @@ Exposes mobile automation capabilities as MCP tools for integration
 with Claude Desktop and other MCP clients.
 """
 
-import asyncio
 import json
 import logging
 from typing import Any, Optional
 
-from ..config import MobileAgentConfig
-from ..agents.mobile_agent import MobileAgent, AgentResult
-from ..droidrun_wrapper import DroidRunWrapper, ScreenState
+from ..agents.mobile_agent import MobileAgent
+from ..droidrun_wrapper import DroidRunWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +18,26 @@ logger = logging.getLogger(__name__)
 _agent: Optional[MobileAgent] = None
 _device: Optional[DroidRunWrapper] = None
 
+# Swipe geometry: screen center (adjust for device) and per-direction signs (x1, y1, x2, y2)
+_SWIPE_CENTER_X, _SWIPE_CENTER_Y = 540, 960
+_SWIPE_DISTANCE = 500
+_SWIPE_DELTAS: dict[str, tuple[int, int, int, int]] = {
+    "up": (0, 1, 0, -1),
+    "down": (0, -1, 0, 1),
+    "left": (1, 0, -1, 0),
+    "right": (-1, 0, 1, 0),
+}
+
+# Pre-serialized responses for tool input validation failures
+_ERR_TAP_MISSING = json.dumps(
+    {"success": False, "error": "Either (x, y) or element_text must be provided"},
+    indent=2,
+)
+_ERR_SWIPE_MISSING = json.dumps(
+    {"success": False, "error": "Either direction or (x1, y1, x2, y2) must be provided"},
+    indent=2,
+)
+
 
 async def _get_agent() -> MobileAgent:
     """Get or create global agent instance."""
@@ -206,26 +224,21 @@ async def mobile_swipe(
         Swipe result
     """
     try:
-        device = await _get_device()
-
         if direction:
-            # Calculate coordinates based on direction
-            cx, cy = 540, 960  # Screen center (adjust for device)
-            distance = 500
-            directions = {
-                "up": (cx, cy + distance, cx, cy - distance),
-                "down": (cx, cy - distance, cx, cy + distance),
-                "left": (cx + distance, cy, cx - distance, cy),
-                "right": (cx - distance, cy, cx + distance, cy),
-            }
-            if direction not in directions:
+            deltas = _SWIPE_DELTAS.get(direction)
+            if deltas is None:
                 return {
                     "success": False,
                     "error": f"Invalid direction: {direction}",
                 }
-            x1, y1, x2, y2 = directions[direction]
+            sx1, sy1, sx2, sy2 = deltas
+            x1 = _SWIPE_CENTER_X + sx1 * _SWIPE_DISTANCE
+            y1 = _SWIPE_CENTER_Y + sy1 * _SWIPE_DISTANCE
+            x2 = _SWIPE_CENTER_X + sx2 * _SWIPE_DISTANCE
+            y2 = _SWIPE_CENTER_Y + sy2 * _SWIPE_DISTANCE
 
         if all(v is not None for v in [x1, y1, x2, y2]):
+            device = await _get_device()
             result = await device.swipe(x1, y1, x2, y2)
             return {
                 "success": result.success,
@@ -281,8 +294,6 @@ def register_mobile_tools(server) -> None:
     Args:
         server: MCP server instance
     """
-    from mcp.server import Server
-
     @server.tool("mobile_execute_task")
     async def tool_execute_task(task: str) -> str:
         """Execute a natural language task on Android device."""
@@ -308,6 +319,8 @@ def register_mobile_tools(server) -> None:
         element_text: str = "",
     ) -> str:
         """Tap on screen at coordinates or element."""
+        if not element_text and (x <= 0 or y <= 0):
+            return _ERR_TAP_MISSING
         result = await mobile_tap(
             x=x if x > 0 else None,
             y=y if y > 0 else None,
@@ -318,7 +331,9 @@ def register_mobile_tools(server) -> None:
     @server.tool("mobile_swipe")
     async def tool_swipe(direction: str = "") -> str:
         """Swipe on screen (up/down/left/right)."""
-        result = await mobile_swipe(direction=direction or None)
+        if not direction:
+            return _ERR_SWIPE_MISSING
+        result = await mobile_swipe(direction=direction)
         return json.dumps(result, indent=2)
 
     @server.tool("mobile_type")
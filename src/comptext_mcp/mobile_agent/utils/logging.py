@@ -4,9 +4,13 @@ Logging configuration for Mobile Agent.
 
 import logging
 import sys
+from contextvars import ContextVar, Token
 from pathlib import Path
 from typing import Optional
 
+# Agent state used as log prefix; per asyncio task, so concurrent agents don't clash
+_AGENT_STATE: ContextVar[str] = ContextVar("agent_state", default="")
+
 
 def setup_mobile_logging(
     level: str = "INFO",
@@ -92,15 +96,25 @@ class JsonFormatter(logging.Formatter):
 class AgentLogAdapter(logging.LoggerAdapter):
     """
     Log adapter that adds agent context to all messages.
+
+    The agent state prefix is read from a context variable set via
+    :meth:`set_state`, falling back to ``extra["agent_state"]``.
     """
 
+    @staticmethod
+    def set_state(state: str) -> Token:
+        """Set the agent state for the current context."""
+        return _AGENT_STATE.set(state)
+
     def process(self, msg, kwargs):
-        extra = kwargs.get("extra", {})
-        extra.update(self.extra)
-        kwargs["extra"] = extra
+        extra = kwargs.get("extra")
+        if extra is None:
+            kwargs["extra"] = self.extra
+        else:
+            extra.update(self.extra)
 
         # Prefix message with agent state if available
-        state = self.extra.get("agent_state", "")
+        state = _AGENT_STATE.get() or self.extra.get("agent_state", "")
         if state:
             msg = f"[{state}] {msg}"
 
@@ -5,12 +5,14 @@ Tracks token usage, latency, costs, and CompText optimization performance.
 """
 
 import time
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Optional
 
+_SEP = "=" * 60
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskMetrics:
     """Metrics for a single task execution."""
     task_id: str
@@ -18,6 +20,10 @@ class TaskMetrics:
     started_at: datetime
     completed_at: Optional[datetime] = None
 
+    # Monotonic clock readings behind started_at/completed_at, immune to clock changes
+    started_at_mono: float = 0.0
+    completed_at_mono: float = 0.0
+
     # Token metrics
     prompt_tokens: int = 0
     completion_tokens: int = 0
@@ -43,7 +49,7 @@ class TaskMetrics:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Aggregated performance metrics."""
     total_tasks: int = 0
@@ -91,13 +97,19 @@ class TokenMetricsCollector:
         self.model = model
         self.tasks: list[TaskMetrics] = []
         self._current_task: Optional[TaskMetrics] = None
+        self._agg = PerformanceMetrics()
+        # Anchor pair used to map monotonic readings back to wall-clock time
+        self._wall_anchor = datetime.now()
+        self._mono_anchor = time.monotonic()
 
     def start_task(self, task_id: str, description: str) -> TaskMetrics:
         """Start tracking a new task."""
+        started_at_mono = time.monotonic()
         task = TaskMetrics(
             task_id=task_id,
             task_description=description,
-            started_at=datetime.now(),
+            started_at=self._wallclock(started_at_mono),
+            started_at_mono=started_at_mono,
         )
         self._current_task = task
         return task
@@ -138,7 +150,8 @@ class TokenMetricsCollector:
             return
 
         task = self._current_task
-        task.completed_at = datetime.now()
+        task.completed_at_mono = time.monotonic()
+        task.completed_at = self._wallclock(task.completed_at_mono)
         task.success = success
         task.error = error
 
@@ -148,11 +161,7 @@ class TokenMetricsCollector:
 
         # Calculate token reduction
         if task.baseline_tokens > 0:
-            task.token_reduction_percent = (
-                (task.baseline_tokens - task.comptext_tokens)
-                / task.baseline_tokens
-                * 100
-            )
+            task.token_reduction_percent = (task.baseline_tokens - task.comptext_tokens) * (100.0 / task.baseline_tokens)
 
         # Estimate cost
         task.estimated_cost_usd = self._calculate_cost(
@@ -161,26 +170,52 @@ class TokenMetricsCollector:
         )
 
         self.tasks.append(task)
+        self._accumulate(task)
         self._current_task = None
 
+    def _accumulate(self, task: TaskMetrics):
+        """Add a completed task to the running totals."""
+        agg = self._agg
+        agg.total_tasks += 1
+        if task.success:
+            agg.successful_tasks += 1
+        else:
+            agg.failed_tasks += 1
+        agg.total_tokens += task.total_tokens
+        agg.total_prompt_tokens += task.prompt_tokens
+        agg.total_completion_tokens += task.completion_tokens
+        agg.total_baseline_tokens += task.baseline_tokens
+        agg.total_comptext_tokens += task.comptext_tokens
+        agg.total_duration_ms += task.total_duration_ms
+        agg.total_steps += task.steps_count
+        agg.successful_steps += task.successful_steps
+        agg.total_cost_usd += task.estimated_cost_usd
+
+    def rebuild_aggregates(self):
+        """Recompute running totals from scratch after ``self.tasks`` was modified directly."""
+        self._agg = PerformanceMetrics()
+        for task in self.tasks:
+            self._accumulate(task)
+
     def get_performance_metrics(self) -> PerformanceMetrics:
         """Get aggregated performance metrics."""
-        if not self.tasks:
+        agg = self._agg
+        if not agg.total_tasks:
             return PerformanceMetrics()
 
         metrics = PerformanceMetrics(
-            total_tasks=len(self.tasks),
-            successful_tasks=sum(1 for t in self.tasks if t.success),
-            failed_tasks=sum(1 for t in self.tasks if not t.success),
-            total_tokens=sum(t.total_tokens for t in self.tasks),
-            total_prompt_tokens=sum(t.prompt_tokens for t in self.tasks),
-            total_completion_tokens=sum(t.completion_tokens for t in self.tasks),
-            total_baseline_tokens=sum(t.baseline_tokens for t in self.tasks),
-            total_comptext_tokens=sum(t.comptext_tokens for t in self.tasks),
-            total_duration_ms=sum(t.total_duration_ms for t in self.tasks),
-            total_steps=sum(t.steps_count for t in self.tasks),
-            successful_steps=sum(t.successful_steps for t in self.tasks),
-            total_cost_usd=sum(t.estimated_cost_usd for t in self.tasks),
+            total_tasks=agg.total_tasks,
+            successful_tasks=agg.successful_tasks,
+            failed_tasks=agg.failed_tasks,
+            total_tokens=agg.total_tokens,
+            total_prompt_tokens=agg.total_prompt_tokens,
+            total_completion_tokens=agg.total_completion_tokens,
+            total_baseline_tokens=agg.total_baseline_tokens,
+            total_comptext_tokens=agg.total_comptext_tokens,
+            total_duration_ms=agg.total_duration_ms,
+            total_steps=agg.total_steps,
+            successful_steps=agg.successful_steps,
+            total_cost_usd=agg.total_cost_usd,
         )
 
         # Calculate averages
@@ -194,14 +229,16 @@ class TokenMetricsCollector:
             metrics.step_success_rate = metrics.successful_steps / metrics.total_steps * 100
 
         if metrics.total_baseline_tokens > 0:
-            metrics.avg_token_reduction_percent = (
-                (metrics.total_baseline_tokens - metrics.total_comptext_tokens)
-                / metrics.total_baseline_tokens
-                * 100
+            metrics.avg_token_reduction_percent = (metrics.total_baseline_tokens - metrics.total_comptext_tokens) * (
+                100.0 / metrics.total_baseline_tokens
             )
 
         return metrics
 
+    def _wallclock(self, mono: float) -> datetime:
+        """Convert a ``time.monotonic()`` reading into a wall-clock datetime."""
+        return self._wall_anchor + timedelta(seconds=mono - self._mono_anchor)
+
     def _calculate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
         """Calculate estimated cost in USD."""
         pricing = self.PRICING.get(self.model, self.PRICING["qwen3-coder:480b"])
@@ -213,38 +250,34 @@ class TokenMetricsCollector:
         """Generate a comparison report between baseline and CompText."""
         metrics = self.get_performance_metrics()
 
-        report = [
-            "=" * 60,
-            "CompText Mobile Agent - Performance Report",
-            "=" * 60,
-            "",
-            f"Total Tasks: {metrics.total_tasks}",
-            f"Success Rate: {metrics.task_success_rate:.1f}%",
-            "",
-            "--- Token Usage ---",
-            f"Total Tokens: {metrics.total_tokens:,}",
-            f"  - Prompt: {metrics.total_prompt_tokens:,}",
-            f"  - Completion: {metrics.total_completion_tokens:,}",
-            "",
-            "--- CompText Optimization ---",
-            f"Baseline Tokens (estimated): {metrics.total_baseline_tokens:,}",
-            f"CompText Tokens (actual): {metrics.total_comptext_tokens:,}",
-            f"Token Reduction: {metrics.avg_token_reduction_percent:.1f}%",
-            "",
-            "--- Performance ---",
-            f"Total Duration: {metrics.total_duration_ms/1000:.2f}s",
-            f"Avg Task Duration: {metrics.avg_task_duration_ms/1000:.2f}s",
-            f"Avg Step Duration: {metrics.avg_step_duration_ms:.0f}ms",
-            "",
-            "--- Cost Analysis ---",
-            f"Total Cost: ${metrics.total_cost_usd:.4f}",
-            f"Avg Cost/Task: ${metrics.avg_cost_per_task_usd:.4f}",
-            f"Model: {self.model}",
-            "",
-            "=" * 60,
-        ]
-
-        return "\n".join(report)
+        return f"""{_SEP}
+CompText Mobile Agent - Performance Report
+{_SEP}
+
+Total Tasks: {metrics.total_tasks}
+Success Rate: {metrics.task_success_rate:.1f}%
+
+--- Token Usage ---
+Total Tokens: {metrics.total_tokens:,}
+  - Prompt: {metrics.total_prompt_tokens:,}
+  - Completion: {metrics.total_completion_tokens:,}
+
+--- CompText Optimization ---
+Baseline Tokens (estimated): {metrics.total_baseline_tokens:,}
+CompText Tokens (actual): {metrics.total_comptext_tokens:,}
+Token Reduction: {metrics.avg_token_reduction_percent:.1f}%
+
+--- Performance ---
+Total Duration: {metrics.total_duration_ms/1000:.2f}s
+Avg Task Duration: {metrics.avg_task_duration_ms/1000:.2f}s
+Avg Step Duration: {metrics.avg_step_duration_ms:.0f}ms
+
+--- Cost Analysis ---
+Total Cost: ${metrics.total_cost_usd:.4f}
+Avg Cost/Task: ${metrics.avg_cost_per_task_usd:.4f}
+Model: {self.model}
+
+{_SEP}"""
 
     def export_csv(self, filepath: str):
         """Export task metrics to CSV."""
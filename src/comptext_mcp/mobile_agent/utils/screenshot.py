@@ -6,18 +6,92 @@ Supports both raw screenshot capture and annotated visualizations.
 """
 
 import asyncio
-import base64
-import io
 import logging
 import os
+import re
+import struct
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# SIMD-accelerated base64 when available, stdlib otherwise
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
 logger = logging.getLogger(__name__)
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+_ANNOTATION_COLORS = ("#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF")
+
+# Focused window lines in `dumpsys window windows`, e.g.
+# mCurrentFocus=Window{... com.android.chrome/org.chromium.chrome.browser.ChromeTabbedActivity}
+_FOCUS_MARKERS = (b"mCurrentFocus", b"mFocusedApp")
+_FOCUS_PATTERN = re.compile(rb"(\S+)/(\S+)\}")
+
+# Annotation font (lazy loaded once)
+_annotation_font = None
+
+
+def _get_annotation_font():
+    """Get the annotation label font, falling back to PIL's default."""
+    global _annotation_font
+    if _annotation_font is None:
+        from PIL import ImageFont
+
+        try:
+            _annotation_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
+        except (OSError, ImportError):
+            _annotation_font = ImageFont.load_default()
+    return _annotation_font
+
+
+def _remove_files(paths: list[str]):
+    """Delete files, ignoring ones that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _remove_files_in_background(paths: list[str]):
+    """Delete files off the event loop when one is running, inline otherwise."""
+    if not paths:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _remove_files(paths)
+        return
+    loop.run_in_executor(None, _remove_files, paths)
+
+
+def _parse_focus(dumpsys_output: bytes) -> tuple[str, str]:
+    """Extract (package, activity) of the focused window without decoding the full dump."""
+    line_starts = set()
+    for marker in _FOCUS_MARKERS:
+        i = dumpsys_output.find(marker)
+        while i != -1:
+            line_starts.add(dumpsys_output.rfind(b"\n", 0, i) + 1)
+            i = dumpsys_output.find(marker, i + 1)
+
+    # First matching line in document order wins
+    for start in sorted(line_starts):
+        end = dumpsys_output.find(b"\n", start)
+        if end == -1:
+            end = len(dumpsys_output)
+        match = _FOCUS_PATTERN.search(dumpsys_output, start, end)
+        if match:
+            return match.group(1).decode(errors="ignore"), match.group(2).decode(errors="ignore")
+
+    return "", ""
+
 
 @dataclass
 class ScreenshotResult:
@@ -63,7 +137,8 @@ class ScreenshotPipeline:
         self.output_dir = Path(output_dir)
         self.max_history = max_history
         self.adb_path = adb_path
-        self._history: list[ScreenshotResult] = []
+        # A negative limit keeps nothing, as a limit of 0 does; deque rejects it
+        self._history: deque[ScreenshotResult] = deque(maxlen=max(max_history, 0))
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -92,55 +167,36 @@ class ScreenshotPipeline:
         output_path = self.output_dir / filename
 
         try:
-            # Capture screenshot via ADB
-            # Method 1: Direct screencap to local file
-            device_path = "/sdcard/screenshot_temp.png"
-
-            # Take screenshot on device
+            # Stream PNG bytes straight from the device (no temp file, pull or cleanup)
             proc = await asyncio.create_subprocess_exec(
-                self.adb_path, "shell", "screencap", "-p", device_path,
+                self.adb_path, "exec-out", "screencap", "-p",
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            _, stderr = await proc.communicate()
+            png_bytes, stderr = await proc.communicate()
 
-            if proc.returncode != 0:
+            if proc.returncode != 0 or not png_bytes:
                 return ScreenshotResult(
                     success=False,
                     error=f"screencap failed: {stderr.decode()}",
                     timestamp=timestamp,
                 )
 
-            # Pull screenshot to local
-            proc = await asyncio.create_subprocess_exec(
-                self.adb_path, "pull", device_path, str(output_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr = await proc.communicate()
-
-            if proc.returncode != 0:
-                return ScreenshotResult(
-                    success=False,
-                    error=f"pull failed: {stderr.decode()}",
-                    timestamp=timestamp,
-                )
-
-            # Clean up device file
-            await asyncio.create_subprocess_exec(
-                self.adb_path, "shell", "rm", device_path,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-
-            # Get image dimensions
-            width, height = await self._get_image_dimensions(output_path)
+            # Write to disk in the background while encoding from memory
+            write_task = asyncio.ensure_future(asyncio.to_thread(output_path.write_bytes, png_bytes))
 
             # Encode to base64 if requested
             base64_data = None
             if include_base64:
-                with open(output_path, "rb") as f:
-                    base64_data = base64.b64encode(f.read()).decode("utf-8")
+                base64_data = _b64encode(png_bytes).decode("ascii")
+
+            await write_task
+
+            # Get image dimensions from the IHDR chunk (always first, data at offset 16)
+            if png_bytes.startswith(_PNG_SIGNATURE) and len(png_bytes) >= 24:
+                width, height = struct.unpack(">II", png_bytes[16:24])
+            else:
+                width, height = await self._get_image_dimensions(output_path)
 
             result = ScreenshotResult(
                 success=True,
@@ -188,35 +244,23 @@ class ScreenshotPipeline:
 
         try:
             # Try to import PIL for annotation
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
 
             img = Image.open(result.path)
             draw = ImageDraw.Draw(img)
+            font = _get_annotation_font()
 
-            # Load font (fallback to default if not available)
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-            except:
-                font = ImageFont.load_default()
-
-            # Draw annotations
-            colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF"]
-
+            # Draw annotations: outline plus index label per element
+            num_colors = len(_ANNOTATION_COLORS)
             for i, element in enumerate(elements[:20]):  # Limit to 20 elements
-                color = colors[i % len(colors)]
+                color = _ANNOTATION_COLORS[i % num_colors]
                 bounds = element.bounds
-
-                # Draw rectangle
                 draw.rectangle(bounds, outline=color, width=2)
+                draw.text((bounds[0] + 2, bounds[1] + 2), str(element.index), fill=color, font=font)
 
-                # Draw index label
-                cx, cy = element.center
-                label = f"{element.index}"
-                draw.text((bounds[0] + 2, bounds[1] + 2), label, fill=color, font=font)
-
-            # Save annotated image
+            # Save annotated image (debug output, so favour encode speed over size)
             annotated_path = result.path.replace(".png", "_annotated.png")
-            img.save(annotated_path)
+            img.save(annotated_path, compress_level=1)
 
             return ScreenshotResult(
                 success=True,
@@ -251,16 +295,19 @@ class ScreenshotPipeline:
 
     def _add_to_history(self, result: ScreenshotResult):
         """Add screenshot to history, removing old ones if needed."""
+        # The deque drops its oldest entry on append once full; with no room
+        # at all the new screenshot itself is dropped
+        if self._history.maxlen == 0:
+            old = result
+        elif len(self._history) == self._history.maxlen:
+            old = self._history[0]
+        else:
+            old = None
         self._history.append(result)
 
-        # Remove old screenshots
-        while len(self._history) > self.max_history:
-            old = self._history.pop(0)
-            if old.path and os.path.exists(old.path):
-                try:
-                    os.remove(old.path)
-                except:
-                    pass
+        # Remove evicted screenshot
+        if old and old.path:
+            _remove_files_in_background([old.path])
 
     @property
     def history(self) -> list[ScreenshotResult]:
@@ -273,12 +320,7 @@ class ScreenshotPipeline:
 
     def clear_history(self):
         """Clear screenshot history and delete files."""
-        for result in self._history:
-            if result.path and os.path.exists(result.path):
-                try:
-                    os.remove(result.path)
-                except:
-                    pass
+        _remove_files_in_background([result.path for result in self._history if result.path])
         self._history.clear()
 
 
@@ -359,20 +401,24 @@ class ScreenContextBuilder:
         lines.append(f"Els:{len(elements)}")
 
         # Elements (limited for token efficiency)
-        for el in elements[:15]:
-            if hasattr(el, 'to_comptext'):
-                lines.append(el.to_comptext())
-            else:
-                # Fallback for dict-like elements
-                idx = el.get("index", 0)
-                text = el.get("text", el.get("content_desc", ""))[:20]
-                cx = el.get("center", (0, 0))[0] if isinstance(el.get("center"), tuple) else 0
-                cy = el.get("center", (0, 0))[1] if isinstance(el.get("center"), tuple) else 0
-                el_type = "K" if el.get("clickable") else "T"
-                lines.append(f"{idx}:{el_type}:{text}@{cx},{cy}")
+        lines.extend(map(self._element_to_comptext, elements[:15]))
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _element_to_comptext(el) -> str:
+        """Format a single UINode or dict-like element as a CompText line."""
+        if hasattr(el, 'to_comptext'):
+            return el.to_comptext()
+
+        # Fallback for dict-like elements
+        idx = el.get("index", 0)
+        text = el.get("text", el.get("content_desc", ""))[:20]
+        center = el.get("center")
+        cx, cy = center if isinstance(center, tuple) else (0, 0)
+        el_type = "K" if el.get("clickable") else "T"
+        return f"{idx}:{el_type}:{text}@{cx},{cy}"
+
     def _build_verbose_state(
         self,
         elements: list,
@@ -407,6 +453,16 @@ class ScreenContextBuilder:
         return "\n".join(lines)
 
 
+async def _run_adb(adb_path: str, *args: str) -> tuple[bytes, bytes]:
+    """Run an ADB command and return its (stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        adb_path, *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    return await proc.communicate()
+
+
 # Convenience function
 async def capture_screen_context(
     adb_path: str = "adb",
@@ -428,39 +484,18 @@ async def capture_screen_context(
     parser = UITreeParser()
     builder = ScreenContextBuilder(use_comptext=use_comptext)
 
-    # Capture screenshot
-    screenshot = await pipeline.capture(include_base64=False)
-
-    # Get UI hierarchy
-    proc = await asyncio.create_subprocess_exec(
-        adb_path, "shell", "uiautomator", "dump", "/dev/tty",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+    # Screenshot, UI hierarchy and focused window are independent ADB calls
+    screenshot, (ui_stdout, _), (window_stdout, _) = await asyncio.gather(
+        pipeline.capture(include_base64=False),
+        _run_adb(adb_path, "shell", "uiautomator", "dump", "/dev/tty"),
+        _run_adb(adb_path, "shell", "dumpsys", "window", "windows"),
     )
-    stdout, _ = await proc.communicate()
 
     # Parse UI
-    xml_content = stdout.decode("utf-8", errors="ignore")
+    xml_content = ui_stdout.decode("utf-8", errors="ignore")
     elements = parser.parse(xml_content)
 
     # Get current package/activity
-    proc = await asyncio.create_subprocess_exec(
-        adb_path, "shell", "dumpsys", "window", "windows",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, _ = await proc.communicate()
-
-    package, activity = "", ""
-    for line in stdout.decode().split("\n"):
-        if "mCurrentFocus" in line or "mFocusedApp" in line:
-            # Extract package/activity from line like:
-            # mCurrentFocus=Window{... com.android.chrome/org.chromium.chrome.browser.ChromeTabbedActivity}
-            import re
-            match = re.search(r'(\S+)/(\S+)\}', line)
-            if match:
-                package = match.group(1)
-                activity = match.group(2)
-                break
+    package, activity = _parse_focus(window_stdout)
 
     return builder.build_context(screenshot, elements, package, activity)
@@ -5,16 +5,121 @@ Parses Android UI hierarchy XML (from `adb shell uiautomator dump`)
 into structured UIElement objects with CompText optimization.
 """
 
-import re
-import xml.etree.ElementTree as ET
+import io
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 import logging
 
-logger = logging.getLogger(__name__)
+# Prefer lxml (C-level parsing and attribute access), fall back to stdlib
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Attribute names are interned so lookups can match by identity; hyphenated
+# names are not interned automatically by the compiler
+_ATTR_BOUNDS = sys.intern("bounds")
+_ATTR_CLASS = sys.intern("class")
+_ATTR_CONTENT_DESC = sys.intern("content-desc")
+_ATTR_ENABLED = sys.intern("enabled")
+_ATTR_PACKAGE = sys.intern("package")
+_ATTR_RESOURCE_ID = sys.intern("resource-id")
+_ATTR_TEXT = sys.intern("text")
+
+# Boolean XML attributes and the UINode fields they map to
+_BOOL_ATTRS = tuple(
+    (sys.intern(attr), name)
+    for attr, name in (
+        ("checkable", "checkable"),
+        ("checked", "checked"),
+        ("clickable", "clickable"),
+        ("enabled", "enabled"),
+        ("focusable", "focusable"),
+        ("focused", "focused"),
+        ("scrollable", "scrollable"),
+        ("long-clickable", "long_clickable"),
+        ("password", "password"),
+        ("selected", "selected"),
+    )
+)
+
+# Attributes that make an element worth keeping even without text/description/id
+_INTERACTIVE_ATTRS = frozenset({"clickable", "scrollable", "checkable"})
+
+
+def _keyword_type(class_name: str) -> Optional[str]:
+    """CompText element type from keywords in the class name (None = generic: clickable or element)."""
+    class_lower = class_name.lower()
+
+    if "button" in class_lower:
+        return "B"  # Button
+    elif "edittext" in class_lower or "textfield" in class_lower:
+        return "I"  # Input
+    elif "checkbox" in class_lower:
+        return "C"  # Checkbox
+    elif "switch" in class_lower or "toggle" in class_lower:
+        return "S"  # Switch
+    elif "image" in class_lower:
+        return "G"  # Graphic/Image
+    elif "text" in class_lower:
+        return "T"  # Text
+    elif "list" in class_lower or "recycler" in class_lower:
+        return "L"  # List
+    elif "scroll" in class_lower:
+        return "R"  # Scrollable Region
+    return None
+
+
+# Element types of the common framework widgets, keyed by full class name so the
+# package path is matched exactly as _keyword_type would match it
+_TYPE_MAP: dict[str, Optional[str]] = {
+    class_name: _keyword_type(class_name)
+    for class_name in (
+        "android.widget.Button",
+        "android.widget.ImageButton",
+        "android.widget.RadioButton",
+        "android.widget.ToggleButton",
+        "android.widget.EditText",
+        "android.widget.AutoCompleteTextView",
+        "android.widget.CheckBox",
+        "android.widget.Switch",
+        "android.widget.ImageView",
+        "android.widget.TextView",
+        "android.widget.CheckedTextView",
+        "android.widget.ListView",
+        "android.widget.ScrollView",
+        "android.widget.HorizontalScrollView",
+        "android.widget.FrameLayout",
+        "android.widget.LinearLayout",
+        "android.widget.RelativeLayout",
+        "android.view.View",
+        "android.view.ViewGroup",
+        "androidx.recyclerview.widget.RecyclerView",
+        "androidx.core.widget.NestedScrollView",
+    )
+}
+
+
+def _parse_bounds(bounds_str: str) -> tuple[int, int, int, int]:
+    """Parse a leading ``[x1,y1][x2,y2]`` bounds string, returning zeros if malformed."""
+    if bounds_str.startswith("["):
+        first, sep, rest = bounds_str[1:].partition("][")
+        end = rest.find("]")
+        if sep and end >= 0:
+            parts = first.split(",") + rest[:end].split(",")
+            # Digits only, as the old regex required: int() would also take signs, spaces and "_"
+            if len(parts) == 4 and all(part.isdecimal() for part in parts):
+                x1, y1, x2, y2 = map(int, parts)
+                return (x1, y1, x2, y2)
+    return (0, 0, 0, 0)
+
+
+@dataclass(slots=True)
 class UINode:
     """Represents a single UI node from the hierarchy."""
     index: int
@@ -35,28 +140,25 @@ class UINode:
     selected: bool = False
     visible: bool = True
     bounds: tuple[int, int, int, int] = (0, 0, 0, 0)
-    children: list["UINode"] = field(default_factory=list)
-
-    @property
-    def center(self) -> tuple[int, int]:
-        """Calculate center coordinates."""
-        x1, y1, x2, y2 = self.bounds
-        return ((x1 + x2) // 2, (y1 + y2) // 2)
 
-    @property
-    def width(self) -> int:
-        return self.bounds[2] - self.bounds[0]
+    # Derived values, computed once at construction
+    center: tuple[int, int] = field(init=False, repr=False, compare=False)
+    width: int = field(init=False, repr=False, compare=False)
+    height: int = field(init=False, repr=False, compare=False)
+    area: int = field(init=False, repr=False, compare=False)
+    display_name: str = field(init=False, repr=False, compare=False)
+    element_type: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def height(self) -> int:
-        return self.bounds[3] - self.bounds[1]
-
-    @property
-    def area(self) -> int:
-        return self.width * self.height
-
-    @property
-    def display_name(self) -> str:
+    def __post_init__(self):
+        x1, y1, x2, y2 = self.bounds
+        self.center = ((x1 + x2) // 2, (y1 + y2) // 2)
+        self.width = x2 - x1
+        self.height = y2 - y1
+        self.area = self.width * self.height
+        self.display_name = self._compute_display_name()
+        self.element_type = self._compute_element_type()
+
+    def _compute_display_name(self) -> str:
         """Get best display name for this element."""
         if self.text:
             return self.text[:30]
@@ -69,31 +171,13 @@ class UINode:
         # Fallback to class name
         return self.class_name.split(".")[-1][:20]
 
-    @property
-    def element_type(self) -> str:
+    def _compute_element_type(self) -> str:
         """Determine element type for CompText shorthand."""
-        class_lower = self.class_name.lower()
-
-        if "button" in class_lower:
-            return "B"  # Button
-        elif "edittext" in class_lower or "textfield" in class_lower:
-            return "I"  # Input
-        elif "checkbox" in class_lower:
-            return "C"  # Checkbox
-        elif "switch" in class_lower or "toggle" in class_lower:
-            return "S"  # Switch
-        elif "image" in class_lower:
-            return "G"  # Graphic/Image
-        elif "text" in class_lower:
-            return "T"  # Text
-        elif "list" in class_lower or "recycler" in class_lower:
-            return "L"  # List
-        elif "scroll" in class_lower:
-            return "R"  # Scrollable Region
-        elif self.clickable:
-            return "K"  # Clickable (generic)
+        if self.class_name in _TYPE_MAP:
+            element_type = _TYPE_MAP[self.class_name]
         else:
-            return "E"  # Element (generic)
+            element_type = _keyword_type(self.class_name)
+        return element_type or ("K" if self.clickable else "E")
 
     def to_comptext(self) -> str:
         """Convert to CompText format: index:type:name@x,y"""
@@ -125,9 +209,6 @@ class UITreeParser:
     structured UINode objects optimized for agent consumption.
     """
 
-    # Bounds pattern: [x1,y1][x2,y2]
-    BOUNDS_PATTERN = re.compile(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]')
-
     def __init__(self, min_area: int = 100, max_elements: int = 50):
         """
         Initialize parser.
@@ -152,18 +233,24 @@ class UITreeParser:
         """
         self._index_counter = 0
 
+        # Stream the XML and filter while parsing, so only relevant nodes are built
+        nodes = []
         try:
-            root = ET.fromstring(xml_content)
+            source = io.BytesIO(xml_content.encode("utf-8"))
+            for event, element in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    node = self._build_node(element.attrib)
+                    if node is not None:
+                        nodes.append(node)
+                    self._index_counter += 1
+                else:
+                    # Attributes were consumed on start; release the subtree
+                    element.clear()
         except ET.ParseError as e:
             logger.error(f"Failed to parse UI XML: {e}")
             return []
 
-        nodes = []
-        self._parse_node(root, nodes)
-
-        # Filter and sort
-        filtered = self._filter_nodes(nodes)
-        sorted_nodes = self._sort_by_relevance(filtered)
+        sorted_nodes = self._sort_by_relevance(nodes)
 
         # Re-index after sorting
         for i, node in enumerate(sorted_nodes[:self.max_elements]):
@@ -171,99 +258,58 @@ class UITreeParser:
 
         return sorted_nodes[:self.max_elements]
 
-    def _parse_node(self, element: ET.Element, nodes: list[UINode], depth: int = 0):
-        """Recursively parse XML element into UINode."""
-        attrib = element.attrib
-
-        # Parse bounds
-        bounds_str = attrib.get("bounds", "[0,0][0,0]")
-        bounds_match = self.BOUNDS_PATTERN.match(bounds_str)
-        if bounds_match:
-            bounds = tuple(int(x) for x in bounds_match.groups())
-        else:
-            bounds = (0, 0, 0, 0)
+    def _build_node(self, attrib) -> Optional[UINode]:
+        """Build a UINode from XML attributes, or None if it is not relevant."""
+        # One pass over the attributes instead of a lookup per flag
+        true_attrs = {key for key, value in attrib.items() if value == "true"}
 
-        node = UINode(
-            index=self._index_counter,
-            text=attrib.get("text", ""),
-            resource_id=attrib.get("resource-id", ""),
-            class_name=attrib.get("class", ""),
-            package=attrib.get("package", ""),
-            content_desc=attrib.get("content-desc", ""),
-            checkable=attrib.get("checkable", "false") == "true",
-            checked=attrib.get("checked", "false") == "true",
-            clickable=attrib.get("clickable", "false") == "true",
-            enabled=attrib.get("enabled", "true") == "true",
-            focusable=attrib.get("focusable", "false") == "true",
-            focused=attrib.get("focused", "false") == "true",
-            scrollable=attrib.get("scrollable", "false") == "true",
-            long_clickable=attrib.get("long-clickable", "false") == "true",
-            password=attrib.get("password", "false") == "true",
-            selected=attrib.get("selected", "false") == "true",
-            bounds=bounds,
-        )
+        # Skip invisible or disabled elements
+        if _ATTR_ENABLED in attrib and _ATTR_ENABLED not in true_attrs:
+            return None
 
-        self._index_counter += 1
-        nodes.append(node)
+        # Skip elements that are too small
+        bounds = _parse_bounds(attrib.get(_ATTR_BOUNDS, "[0,0][0,0]"))
+        x1, y1, x2, y2 = bounds
+        if (x2 - x1) * (y2 - y1) < self.min_area:
+            return None
 
-        # Parse children
-        for child in element:
-            child_node = self._parse_node(child, nodes, depth + 1)
-            if child_node:
-                node.children.append(child_node)
+        # Skip elements with no meaningful content and not interactive
+        text = attrib.get(_ATTR_TEXT, "")
+        resource_id = attrib.get(_ATTR_RESOURCE_ID, "")
+        content_desc = attrib.get(_ATTR_CONTENT_DESC, "")
+        if not (text or content_desc or resource_id) and true_attrs.isdisjoint(_INTERACTIVE_ATTRS):
+            return None
 
-        return node
+        flags = {name: attr in true_attrs for attr, name in _BOOL_ATTRS}
+        flags["enabled"] = True
 
-    def _filter_nodes(self, nodes: list[UINode]) -> list[UINode]:
-        """Filter nodes based on relevance criteria."""
-        filtered = []
-
-        for node in nodes:
-            # Skip invisible or disabled elements
-            if not node.enabled:
-                continue
-
-            # Skip elements that are too small
-            if node.area < self.min_area:
-                continue
-
-            # Skip elements with no meaningful content and not interactive
-            has_content = bool(node.text or node.content_desc or node.resource_id)
-            is_interactive = node.clickable or node.scrollable or node.checkable
-
-            if not has_content and not is_interactive:
-                continue
-
-            filtered.append(node)
-
-        return filtered
+        return UINode(
+            index=self._index_counter,
+            text=text,
+            resource_id=resource_id,
+            class_name=attrib.get(_ATTR_CLASS, ""),
+            package=attrib.get(_ATTR_PACKAGE, ""),
+            content_desc=content_desc,
+            bounds=bounds,
+            **flags,
+        )
 
     def _sort_by_relevance(self, nodes: list[UINode]) -> list[UINode]:
         """Sort nodes by relevance for agent interaction."""
         def relevance_score(node: UINode) -> tuple:
-            # Higher score = more relevant
-            score = 0
-
-            # Interactive elements are most important
-            if node.clickable:
-                score += 100
-            if node.scrollable:
-                score += 50
-            if node.checkable:
-                score += 40
-
-            # Elements with text/description are valuable
-            if node.text:
-                score += 30
-            if node.content_desc:
-                score += 20
-            if node.resource_id:
-                score += 10
+            # Higher score = more relevant: interactive elements first, then
+            # elements with text/description/id. Bools add as 0/1 without branching.
+            score = (
+                100 * node.clickable
+                + 50 * node.scrollable
+                + 40 * node.checkable
+                + 30 * (node.text != "")
+                + 20 * (node.content_desc != "")
+                + 10 * (node.resource_id != "")
+            )
 
             # Prefer elements higher on screen (usually more important)
-            y_position = node.bounds[1]
-
-            return (-score, y_position, node.bounds[0])
+            return (-score, node.bounds[1], node.bounds[0])
 
         return sorted(nodes, key=relevance_score)
 
@@ -291,8 +337,7 @@ class UITreeParser:
 
         # Elements
         lines.append("Els:")
-        for node in nodes:
-            lines.append(node.to_comptext())
+        lines.extend(node.to_comptext() for node in nodes)
 
         return "\n".join(lines)
 
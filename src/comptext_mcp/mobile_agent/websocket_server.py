@@ -12,10 +12,11 @@ Provides live updates during agent task execution including:
 import asyncio
 import json
 import logging
+import sys
 import time
-from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Any, Callable, Optional, Set
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
 from weakref import WeakSet
 
 try:
@@ -26,6 +27,11 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
     WebSocketServerProtocol = Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import MobileAgentConfig
 from .agents.mobile_agent import MobileAgent, AgentResult, AgentStep, AgentState
 
@@ -58,22 +64,49 @@ class EventType(str, Enum):
     PROGRESS_UPDATE = "progress_update"
 
 
-@dataclass
+# Interned wire names, avoiding the Enum.value descriptor on every serialization
+_TYPE_VALUES = {event_type: sys.intern(event_type.value) for event_type in EventType}
+
+
+# Shared payload for events without data; never mutated
+_EMPTY_DATA: dict = {}
+
+
 class WebSocketEvent:
     """WebSocket event payload."""
-    type: EventType
-    timestamp: float = field(default_factory=time.time)
-    task_id: Optional[str] = None
-    data: dict = field(default_factory=dict)
+
+    __slots__ = ("type", "timestamp", "task_id", "data")
+
+    def __init__(
+        self,
+        type: EventType,
+        timestamp: Optional[float] = None,
+        task_id: Optional[str] = None,
+        data: Optional[dict] = None,
+    ):
+        self.type = type
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.task_id = task_id
+        self.data = _EMPTY_DATA if data is None else data
+
+    def __repr__(self) -> str:
+        return (
+            f"WebSocketEvent(type={self.type!r}, timestamp={self.timestamp!r}, "
+            f"task_id={self.task_id!r}, data={self.data!r})"
+        )
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps({
-            "type": self.type.value,
+        payload = {
+            "type": _TYPE_VALUES[self.type],
             "timestamp": self.timestamp,
             "task_id": self.task_id,
             "data": self.data,
-        })
+        }
+        if orjson is not None:
+            # Decoded so clients keep receiving text frames
+            return orjson.dumps(payload).decode()
+        return json.dumps(payload)
 
 
 class WebSocketMobileAgent(MobileAgent):
@@ -87,30 +120,45 @@ class WebSocketMobileAgent(MobileAgent):
         self,
         config: Optional[MobileAgentConfig] = None,
         broadcast_callback: Optional[Callable[[WebSocketEvent], None]] = None,
+        has_clients: Optional[Callable[[], bool]] = None,
     ):
         super().__init__(config)
         self._broadcast = broadcast_callback
+        # Lets _emit skip building events nobody would receive
+        self._has_clients = has_clients
         self._task_id: Optional[str] = None
         self._step_count = 0
+        # Telemetry of the running step, sent as one STEP_COMPLETED event
+        self._pending_step_data: dict = {}
+        self._last_emitted_state: Optional[AgentState] = None
 
     def _emit(self, event_type: EventType, data: dict = None):
         """Emit WebSocket event."""
+        if self._has_clients is not None and not self._has_clients():
+            return
         if self._broadcast:
             event = WebSocketEvent(
                 type=event_type,
                 task_id=self._task_id,
-                data=data or {},
+                data=data,
             )
             try:
                 self._broadcast(event)
             except Exception as e:
                 logger.warning(f"Failed to broadcast event: {e}")
 
+    def _emit_state(self):
+        """Emit STATE_CHANGED if the state differs from the last one sent."""
+        if self._state != self._last_emitted_state:
+            self._last_emitted_state = self._state
+            self._emit(EventType.STATE_CHANGED, {"state": self._state.value})
+
     async def execute(self, task: str) -> AgentResult:
         """Execute task with WebSocket updates."""
         import uuid
         self._task_id = str(uuid.uuid4())[:8]
         self._step_count = 0
+        self._last_emitted_state = None
 
         self._emit(EventType.TASK_STARTED, {
             "task": task,
@@ -149,7 +197,14 @@ class WebSocketMobileAgent(MobileAgent):
         from .droidrun_wrapper import ActionResult
         from .ollama_client import ChatMessage
 
-        start_time = time.time()
+        # Hot-loop lookups bound once
+        now = time.time
+        emit = self._emit
+        emit_state = self._emit_state
+        sleep = asyncio.sleep
+        max_steps = self.config.agent.max_steps
+
+        start_time = now()
         self._current_task = task
         self._state = AgentState.PLANNING
 
@@ -160,7 +215,7 @@ class WebSocketMobileAgent(MobileAgent):
             screen = await self.device.get_screen_state()
             self._add_to_context(screen)
 
-            self._emit(EventType.SCREEN_UPDATED, {
+            emit(EventType.SCREEN_UPDATED, {
                 "package": screen.package,
                 "activity": screen.activity,
                 "element_count": len(screen.elements),
@@ -168,125 +223,123 @@ class WebSocketMobileAgent(MobileAgent):
 
             messages = self._build_initial_messages(task, screen)
 
-            for step_num in range(self.config.agent.max_steps):
+            for step_num in range(max_steps):
                 self._step_count = step_num + 1
-                step_start = time.time()
+                step_start = now()
+                self._pending_step_data = pending = {
+                    "step": step_num + 1,
+                    "action": None,
+                    "success": False,
+                    "progress": (step_num + 1) / max_steps * 100,
+                    "max_steps": max_steps,
+                }
 
                 # Emit step started
-                self._emit(EventType.STEP_STARTED, {
+                emit(EventType.STEP_STARTED, {
                     "step": step_num + 1,
-                    "max_steps": self.config.agent.max_steps,
+                    "max_steps": max_steps,
                 })
 
-                self._state = AgentState.PLANNING
-                self._emit(EventType.STATE_CHANGED, {"state": self._state.value})
+                try:
+                    self._state = AgentState.PLANNING
+                    emit_state()
 
-                # Get LLM response
-                response = await self.ollama.chat(messages)
-                result.total_tokens += response.total_tokens
+                    # Get LLM response
+                    response = await self.ollama.chat(messages)
+                    result.total_tokens += response.total_tokens
 
-                self._emit(EventType.TOKENS_USED, {
-                    "step_tokens": response.total_tokens,
-                    "total_tokens": result.total_tokens,
-                })
+                    pending["step_tokens"] = response.total_tokens
+                    pending["total_tokens"] = result.total_tokens
 
-                # Parse action
-                action_data = self._parse_action(response.message.content)
-                if not action_data:
-                    logger.warning(f"Failed to parse action: {response.message.content}")
-                    continue
-
-                step = AgentStep(
-                    step_number=step_num + 1,
-                    action=action_data.get("action", "unknown"),
-                    reasoning=action_data.get("thought", ""),
-                    screen_before=screen,
-                    tokens_used=response.total_tokens,
-                )
-
-                # Check for completion
-                if action_data.get("action") == "done":
-                    step.result = ActionResult(
-                        success=True,
-                        action=self.device.__class__.__name__,
-                        message="Task completed",
-                    )
-                    result.steps.append(step)
-                    result.success = True
-                    self._state = AgentState.COMPLETED
-                    self._emit(EventType.STATE_CHANGED, {"state": self._state.value})
-                    break
-
-                # Execute action
-                self._state = AgentState.EXECUTING
-                self._emit(EventType.STATE_CHANGED, {"state": self._state.value})
-
-                action_result = await self._execute_action(action_data, screen)
-                step.result = action_result
-
-                self._emit(EventType.ACTION_EXECUTED, {
-                    "action": action_data.get("action"),
-                    "success": action_result.success,
-                    "message": action_result.message,
-                    "error": action_result.error,
-                })
-
-                # Verify and get new screen state
-                self._state = AgentState.VERIFYING
-                self._emit(EventType.STATE_CHANGED, {"state": self._state.value})
-
-                await asyncio.sleep(self.config.agent.step_delay)
-                screen = await self.device.get_screen_state()
-                step.screen_after = screen
-                self._add_to_context(screen)
-
-                self._emit(EventType.SCREEN_UPDATED, {
-                    "package": screen.package,
-                    "activity": screen.activity,
-                    "element_count": len(screen.elements),
-                })
+                    # Parse action
+                    action_data = self._parse_action(response.message.content)
+                    if not action_data:
+                        logger.warning(f"Failed to parse action: {response.message.content}")
+                        continue
 
-                step.duration_ms = (time.time() - step_start) * 1000
-                result.steps.append(step)
+                    step = AgentStep(
+                        step_number=step_num + 1,
+                        action=action_data.get("action", "unknown"),
+                        reasoning=action_data.get("thought", ""),
+                        screen_before=screen,
+                        tokens_used=response.total_tokens,
+                    )
+                    pending["action"] = step.action
+
+                    # Check for completion
+                    if action_data.get("action") == "done":
+                        step.result = ActionResult(
+                            success=True,
+                            action=self.device.__class__.__name__,
+                            message="Task completed",
+                        )
+                        result.steps.append(step)
+                        result.success = True
+                        pending["success"] = True
+                        self._state = AgentState.COMPLETED
+                        emit_state()
+                        break
 
-                # Emit step completed
-                self._emit(EventType.STEP_COMPLETED, {
-                    "step": step_num + 1,
-                    "action": step.action,
-                    "success": action_result.success,
-                    "duration_ms": step.duration_ms,
-                })
+                    # Execute action
+                    self._state = AgentState.EXECUTING
+                    emit_state()
+
+                    action_result = await self._execute_action(action_data, screen)
+                    step.result = action_result
+                    pending["success"] = action_result.success
+
+                    emit(EventType.ACTION_EXECUTED, {
+                        "action": action_data.get("action"),
+                        "success": action_result.success,
+                        "message": action_result.message,
+                        "error": action_result.error,
+                    })
+
+                    # Verify and get new screen state
+                    self._state = AgentState.VERIFYING
+                    emit_state()
+
+                    await sleep(self.config.agent.step_delay)
+                    screen = await self.device.get_screen_state()
+                    step.screen_after = screen
+                    self._add_to_context(screen)
+
+                    emit(EventType.SCREEN_UPDATED, {
+                        "package": screen.package,
+                        "activity": screen.activity,
+                        "element_count": len(screen.elements),
+                    })
+
+                    step.duration_ms = pending["duration_ms"] = (now() - step_start) * 1000
+                    result.steps.append(step)
 
-                # Progress update
-                progress = (step_num + 1) / self.config.agent.max_steps * 100
-                self._emit(EventType.PROGRESS_UPDATE, {
-                    "progress": progress,
-                    "step": step_num + 1,
-                    "max_steps": self.config.agent.max_steps,
-                })
+                    # Update conversation
+                    messages.append(ChatMessage(
+                        role="assistant",
+                        content=response.message.content,
+                    ))
+                    messages.append(ChatMessage(
+                        role="user",
+                        content=self._build_step_feedback(action_result, screen),
+                    ))
 
-                # Update conversation
-                messages.append(ChatMessage(
-                    role="assistant",
-                    content=response.message.content,
-                ))
-                messages.append(ChatMessage(
-                    role="user",
-                    content=self._build_step_feedback(action_result, screen),
-                ))
-
-                # Handle failure with retry
-                if not action_result.success:
-                    if step_num < self.config.agent.retry_attempts:
-                        logger.warning(f"Action failed, retrying: {action_result.error}")
-                        continue
-                    else:
-                        result.error = f"Action failed: {action_result.error}"
-                        self._state = AgentState.FAILED
-                        break
+                    # Handle failure with retry
+                    if not action_result.success:
+                        if step_num < self.config.agent.retry_attempts:
+                            logger.warning(f"Action failed, retrying: {action_result.error}")
+                            continue
+                        else:
+                            result.error = f"Action failed: {action_result.error}"
+                            self._state = AgentState.FAILED
+                            break
+                finally:
+                    # Every way out of the step, including the parse-failure
+                    # continue and the done break, reports its telemetry once
+                    pending.setdefault("duration_ms", (now() - step_start) * 1000)
+                    emit(EventType.STEP_COMPLETED, pending)
 
             result.final_screen = screen
-            result.total_duration_ms = (time.time() - start_time) * 1000
+            result.total_duration_ms = (now() - start_time) * 1000
 
             if not result.success and self._state != AgentState.FAILED:
                 result.error = "Max steps reached without completing task"
@@ -296,7 +349,7 @@ class WebSocketMobileAgent(MobileAgent):
             logger.exception(f"Agent execution failed: {e}")
             result.error = str(e)
             self._state = AgentState.FAILED
-            self._emit(EventType.ERROR, {"error": str(e)})
+            emit(EventType.ERROR, {"error": str(e)})
 
         return result
 
@@ -312,6 +365,9 @@ class MobileAgentWebSocketServer:
     - Automatic reconnection support
     """
 
+    # Max pending broadcast messages per client before events are dropped
+    CLIENT_QUEUE_SIZE = 1024
+
     def __init__(
         self,
         host: str = "localhost",
@@ -328,7 +384,14 @@ class MobileAgentWebSocketServer:
         self.port = port
         self.config = config or MobileAgentConfig.from_env()
 
-        self._clients: Set[WebSocketServerProtocol] = set()
+        self._clients: WeakSet[WebSocketServerProtocol] = WeakSet()
+        # Clients that asked for screenshots as raw PNG binary frames
+        self._binary_clients: WeakSet[WebSocketServerProtocol] = WeakSet()
+        # Outgoing broadcast messages per client, drained by a writer task each
+        self._client_queues: dict[WebSocketServerProtocol, asyncio.Queue] = {}
+        # Agent events, fanned out to clients by a single broadcaster task
+        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._broadcaster_task: Optional[asyncio.Task] = None
         self._server = None
         self._agent: Optional[WebSocketMobileAgent] = None
         self._running = False
@@ -343,6 +406,7 @@ class MobileAgentWebSocketServer:
             ping_interval=30,
             ping_timeout=10,
         )
+        self._broadcaster_task = asyncio.create_task(self._broadcast_loop())
         self._running = True
         logger.info(f"WebSocket server started on ws://{self.host}:{self.port}")
 
@@ -354,10 +418,14 @@ class MobileAgentWebSocketServer:
         if self._current_task and not self._current_task.done():
             self._current_task.cancel()
 
+        if self._broadcaster_task:
+            self._broadcaster_task.cancel()
+
         # Close all client connections
-        for client in list(self._clients):
+        for client in tuple(self._clients):
             await client.close()
         self._clients.clear()
+        self._client_queues.clear()
 
         # Stop server
         if self._server:
@@ -369,6 +437,9 @@ class MobileAgentWebSocketServer:
     async def _handler(self, websocket: WebSocketServerProtocol):
         """Handle WebSocket client connections."""
         self._clients.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        self._client_queues[websocket] = queue
+        writer = asyncio.create_task(self._writer(websocket, queue))
         client_id = id(websocket)
         logger.info(f"Client {client_id} connected")
 
@@ -389,6 +460,25 @@ class MobileAgentWebSocketServer:
             logger.info(f"Client {client_id} disconnected")
         finally:
             self._clients.discard(websocket)
+            self._binary_clients.discard(websocket)
+            self._client_queues.pop(websocket, None)
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocketServerProtocol, queue: asyncio.Queue):
+        """Send queued broadcast messages to a single client."""
+        try:
+            while True:
+                # One broadcast: a JSON text frame, optionally followed by a binary frame
+                for frame in await queue.get():
+                    await websocket.send(frame)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to client: {e}")
+
+        # Stop broadcasting to a dead client right away, not when its handler exits
+        self._clients.discard(websocket)
+        self._client_queues.pop(websocket, None)
 
     async def _handle_message(self, websocket: WebSocketServerProtocol, message: str):
         """Handle incoming WebSocket message."""
@@ -414,6 +504,12 @@ class MobileAgentWebSocketServer:
             elif command == "screenshot":
                 await self._capture_screenshot()
 
+            elif command == "binary_screenshots":
+                if data.get("enabled", True):
+                    self._binary_clients.add(websocket)
+                else:
+                    self._binary_clients.discard(websocket)
+
             elif command == "status":
                 await self._send_status(websocket)
 
@@ -440,7 +536,8 @@ class MobileAgentWebSocketServer:
         async def execute():
             async with WebSocketMobileAgent(
                 self.config,
-                broadcast_callback=lambda e: asyncio.create_task(self._broadcast(e)),
+                broadcast_callback=self._event_queue.put_nowait,
+                has_clients=self._has_clients,
             ) as agent:
                 if not await agent.initialize():
                     await self._broadcast(WebSocketEvent(
@@ -457,12 +554,30 @@ class MobileAgentWebSocketServer:
         from .droidrun_wrapper import DroidRunWrapper
 
         device = DroidRunWrapper(self.config.adb)
-        if await device.connect():
-            path = await device.screenshot()
-            await self._broadcast(WebSocketEvent(
-                type=EventType.SCREEN_UPDATED,
-                data={"screenshot_path": path},
-            ))
+        if not await device.connect():
+            return
+
+        path = await device.screenshot()
+        if not path:
+            logger.warning("Screenshot capture returned no file")
+            return
+
+        event = WebSocketEvent(type=EventType.SCREEN_UPDATED, data={"screenshot_path": path})
+        binary = None
+        if any(client in self._client_queues for client in self._binary_clients):
+            try:
+                png = await asyncio.to_thread(Path(path).read_bytes)
+            except OSError as e:
+                logger.warning(f"Failed to read screenshot {path}: {e}")
+            else:
+                # Raw PNG bytes go out as a binary frame after the JSON header,
+                # avoiding base64 inflation of the image
+                binary = (WebSocketEvent(
+                    type=EventType.SCREEN_UPDATED,
+                    data={"screenshot_path": path, "binary": "image/png", "size": len(png)},
+                ), png)
+
+        await self._broadcast(event, binary=binary)
 
     async def _send_status(self, websocket: WebSocketServerProtocol):
         """Send current status to client."""
@@ -499,21 +614,55 @@ class MobileAgentWebSocketServer:
 
     async def _send_to_client(self, websocket: WebSocketServerProtocol, event: WebSocketEvent):
         """Send event to specific client."""
+        # Queued behind pending broadcasts so the client's writer task stays the only sender
+        queue = self._client_queues.get(websocket)
+        if queue is None:
+            return
         try:
-            await websocket.send(event.to_json())
-        except Exception as e:
-            logger.warning(f"Failed to send to client: {e}")
+            queue.put_nowait((event.to_json(),))
+        except asyncio.QueueFull:
+            logger.warning("Client send queue full, dropping event")
+
+    def _has_clients(self) -> bool:
+        """Whether any client is connected to receive broadcasts."""
+        return bool(self._client_queues)
+
+    async def _broadcast_loop(self):
+        """Drain agent events and broadcast them in order."""
+        get_event = self._event_queue.get
+        broadcast = self._broadcast
+        while True:
+            event = await get_event()
+            try:
+                await broadcast(event)
+            except Exception as e:
+                logger.warning(f"Failed to broadcast event: {e}")
 
-    async def _broadcast(self, event: WebSocketEvent):
-        """Broadcast event to all connected clients."""
-        if not self._clients:
+    async def _broadcast(
+        self,
+        event: WebSocketEvent,
+        binary: Optional[Tuple[WebSocketEvent, bytes]] = None,
+    ):
+        """
+        Broadcast event to all connected clients.
+
+        Args:
+            event: Event sent as a JSON text frame
+            binary: Optional (event, payload) sent instead of event to clients that enabled
+                binary screenshots; the payload follows its event as a binary frame
+        """
+        if not self._client_queues:
             return
 
-        message = event.to_json()
-        await asyncio.gather(
-            *[client.send(message) for client in self._clients],
-            return_exceptions=True,
-        )
+        # Serialize once; each client's writer task does the actual send
+        frames = (event.to_json(),)
+        binary_frames = frames if binary is None else (binary[0].to_json(), binary[1])
+        binary_clients = self._binary_clients
+        for client, queue in self._client_queues.items():
+            try:
+                queue.put_nowait(binary_frames if client in binary_clients else frames)
+            except asyncio.QueueFull:
+                logger.warning("Client send queue full, dropping event")
 
 
 async def run_websocket_server(
@@ -540,6 +689,15 @@ async def run_websocket_server(
         await server.stop()
 
 
+def run_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 # CLI integration
 def main():
     """Main entry point for standalone WebSocket server."""
@@ -556,7 +714,7 @@ def main():
         format="%(asctime)s | %(levelname)-8s | %(message)s",
     )
 
-    asyncio.run(run_websocket_server(args.host, args.port))
+    run_event_loop(run_websocket_server(args.host, args.port))
 
 
 if __name__ == "__main__":
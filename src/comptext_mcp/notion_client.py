@@ -2,14 +2,45 @@
 
 from notion_client import Client
 from notion_client.errors import APIResponseError
-from typing import List, Dict, Any
+from typing import AsyncIterator, Iterable, List, Dict, Any, NamedTuple, Optional, Tuple
+import asyncio
+import httpx
+import io
 import os
 import logging
 import time
-from functools import lru_cache, wraps
-
-from .constants import CACHE_SIZE, DEFAULT_DATABASE_ID, MAX_RETRIES, RETRY_DELAY, BACKOFF_FACTOR
-from .utils import validate_page_id, validate_query_string, sanitize_text_output
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import partial, wraps
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .constants import (
+    BACKOFF_FACTOR,
+    CACHE_SIZE,
+    CACHE_TTL,
+    DEFAULT_DATABASE_ID,
+    MAX_RETRIES,
+    NOTION_MAX_CONNECTIONS,
+    NOTION_MAX_KEEPALIVE_CONNECTIONS,
+    NOTION_PAGE_SIZE,
+    PARSED_PAGE_CACHE_SIZE,
+    QUERY_CACHE_SIZE,
+    QUERY_CACHE_TTL,
+    RETRY_DELAY,
+)
+from .utils import compute_statistics, validate_page_id, validate_query_string, sanitize_text_output
 
 # Logging Setup
 logger = logging.getLogger(__name__)
@@ -17,16 +48,79 @@ logger = logging.getLogger(__name__)
 # Configuration
 NOTION_TOKEN = os.getenv("NOTION_API_TOKEN")
 CODEX_DB_ID = os.getenv("COMPTEXT_DATABASE_ID", DEFAULT_DATABASE_ID)
+MODULES_CACHE_TTL = int(os.getenv("COMPTEXT_CACHE_TTL", CACHE_TTL))
+
+
+class _OrjsonClient(Client):
+    """Notion client that decodes successful response bodies with orjson"""
+
+    def _parse_response(self, response):
+        if response.is_error:
+            # Error bodies go through the SDK so they still raise APIResponseError
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
 
 # Initialize Notion Client (only if token is available)
 # This allows tests to run with mocked clients
 if NOTION_TOKEN:
-    notion = Client(auth=NOTION_TOKEN)
+    # One persistent pool shared by all executor threads; with h2 installed concurrent
+    # calls are multiplexed over a single connection instead of opening new TLS sessions
+    _http_client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=NOTION_MAX_CONNECTIONS,
+            max_keepalive_connections=NOTION_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+    notion = (_OrjsonClient if orjson is not None else Client)(auth=NOTION_TOKEN, client=_http_client)
 else:
     # For testing without credentials - will be mocked
     notion = None
     logger.warning("NOTION_API_TOKEN not set - notion client not initialized")
 
+# The Notion SDK is synchronous; its calls run on a dedicated pool so they never
+# block the event loop and keep reusing the SDK's pooled HTTP connections.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notion")
+
+_modules_cache: Optional[List[Dict[str, Any]]] = None
+_modules_cached_at = 0.0  # time.monotonic() of the last cache fill
+_refresh_task: Optional[asyncio.Task] = None
+# Serializes cache fills so concurrent misses share a single Notion fetch
+_refresh_lock = asyncio.Lock()
+# Fraction of MODULES_CACHE_TTL after which a hit also schedules a background refresh
+_REFRESH_AHEAD = 0.8
+# Lowercased "titel\0beschreibung\0tags" per cached module, built when its page is parsed
+_search_blob: List[str] = []
+# ASCII character bitmask of each _search_blob entry, used to reject entries cheaply
+_search_masks: List[int] = []
+# Length of the longest field of each _search_blob entry; longer queries cannot match it
+_search_longest: List[int] = []
+
+_FIELD_SEP = "\0"
+
+# get_statistics result for _modules_cache, computed once per cache fill
+_statistics: Optional[Dict[str, Any]] = None
+
+
+class _IndexedPage(NamedTuple):
+    """parse_page result with the search data derived from it"""
+
+    module: Dict[str, Any]
+    search_text: str
+    longest_field: int
+    char_mask: int
+
+
+# _IndexedPage entries keyed by (page id, last_edited_time)
+_parsed_pages: Dict[tuple, _IndexedPage] = {}
+
+# get_page_content results as page id -> (last_edited_time, rendered text)
+_page_content_cache: Dict[str, Tuple[str, str]] = {}
+
+# Result caches of the _ttl_cached filter queries, emptied by clear_cache()
+_query_caches: List[Dict[tuple, Tuple[float, Any]]] = []
+
 
 class NotionClientError(Exception):
     """Custom exception for Notion client errors"""
@@ -34,10 +128,54 @@ class NotionClientError(Exception):
     pass
 
 
+# 4xx statuses worth retrying: 409 conflict_error and 429 rate_limited
+_RETRYABLE_CLIENT_ERRORS = frozenset({409, 429})
+
+
 def retry_on_failure(max_retries: int = MAX_RETRIES):
-    """Decorator to retry function on failure with exponential backoff"""
+    """
+    Decorator to retry function on failure with exponential backoff.
+
+    Coroutine functions get an async wrapper that backs off with ``asyncio.sleep``
+    so the event loop keeps running; plain functions keep blocking ``time.sleep``.
+    Client errors other than conflicts and rate limits fail on the first attempt.
+    """
 
     def decorator(func):
+        def on_api_error(retries: int, e: APIResponseError) -> float:
+            if 400 <= e.status < 500 and e.status not in _RETRYABLE_CLIENT_ERRORS:
+                # Bad requests, auth and missing pages fail the same way on every attempt
+                logger.error(f"Notion rejected {func.__name__}: {e}")
+                raise NotionClientError(f"Request rejected ({e.status}): {e}")
+            if retries >= max_retries:
+                logger.error(f"Max retries reached for {func.__name__}: {e}")
+                raise NotionClientError(f"Failed after {max_retries} retries: {e}")
+
+            wait_time = RETRY_DELAY * (BACKOFF_FACTOR ** (retries - 1))
+            logger.warning(f"Retry {retries}/{max_retries} for {func.__name__} after {wait_time}s: {e}")
+            return wait_time
+
+        def on_unexpected_error(e: Exception) -> NotionClientError:
+            logger.error(f"Unexpected error in {func.__name__}: {e}")
+            return NotionClientError(f"Unexpected error: {e}")
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retries = 0
+                while retries < max_retries:
+                    try:
+                        return await func(*args, **kwargs)
+                    except APIResponseError as e:
+                        retries += 1
+                        await asyncio.sleep(on_api_error(retries, e))
+                    except Exception as e:
+                        raise on_unexpected_error(e)
+                return None
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
@@ -46,16 +184,9 @@ def retry_on_failure(max_retries: int = MAX_RETRIES):
                     return func(*args, **kwargs)
                 except APIResponseError as e:
                     retries += 1
-                    if retries >= max_retries:
-                        logger.error(f"Max retries reached for {func.__name__}: {e}")
-                        raise NotionClientError(f"Failed after {max_retries} retries: {e}")
-
-                    wait_time = RETRY_DELAY * (BACKOFF_FACTOR ** (retries - 1))
-                    logger.warning(f"Retry {retries}/{max_retries} for {func.__name__} after {wait_time}s: {e}")
-                    time.sleep(wait_time)
+                    time.sleep(on_api_error(retries, e))
                 except Exception as e:
-                    logger.error(f"Unexpected error in {func.__name__}: {e}")
-                    raise NotionClientError(f"Unexpected error: {e}")
+                    raise on_unexpected_error(e)
             return None
 
         return wrapper
@@ -63,12 +194,135 @@ def retry_on_failure(max_retries: int = MAX_RETRIES):
     return decorator
 
 
+def _single_flight(func):
+    """
+    Decorator that coalesces concurrent identical calls of a coroutine function.
+
+    Callers arriving while a call with the same arguments is in flight await its
+    result instead of issuing their own Notion request.
+    """
+    inflight: Dict[tuple, asyncio.Future] = {}
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        future = inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(future)
+
+    return wrapper
+
+
+def _ttl_cached(maxsize: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+    """
+    Decorator that caches a coroutine function's results for ttl seconds.
+
+    At most maxsize argument combinations are kept, evicting the oldest first,
+    so arbitrary user input cannot grow the cache without bound. Failures are
+    not cached. clear_cache() empties every cache created here.
+    """
+
+    def decorator(func):
+        cache: Dict[tuple, Tuple[float, Any]] = {}
+        _query_caches.append(cache)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+            result = await func(*args, **kwargs)
+            cache.pop(key, None)
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[key] = (time.monotonic(), result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def _run_blocking(func, **kwargs) -> Any:
+    """Run a blocking Notion SDK call on the client thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, **kwargs))
+
+
+async def _paginate(func, **kwargs) -> AsyncIterator[Dict]:
+    """
+    Yield every result of a paginated Notion list endpoint, following next_cursor.
+
+    Args:
+        func: Notion SDK endpoint (databases.query, blocks.children.list, ...)
+        **kwargs: Endpoint arguments
+
+    Yields:
+        Raw Notion objects, fetched one response page at a time
+    """
+    kwargs.setdefault("page_size", NOTION_PAGE_SIZE)
+    while True:
+        response = await _run_blocking(func, **kwargs)
+        for result in response["results"]:
+            yield result
+        if not response.get("has_more"):
+            return
+        kwargs["start_cursor"] = response["next_cursor"]
+
+
+def _query_all(**kwargs) -> AsyncIterator[Dict]:
+    """
+    Yield every page of a Codex database query, following Notion's pagination.
+
+    Args:
+        **kwargs: Extra databases.query arguments (filter, page_size, ...)
+
+    Yields:
+        Raw Notion page objects, fetched one response page at a time
+    """
+    return _paginate(notion.databases.query, database_id=CODEX_DB_ID, **kwargs)
+
+
+_plain_text = itemgetter("plain_text")
+_option_name = itemgetter("name")
+
+
 def _extract_text_from_rich_text(rich_text: List[Dict]) -> str:
     """Extract plain text from Notion rich text objects"""
     if not rich_text:
         return ""
-    text = "".join([rt.get("plain_text", "") for rt in rich_text])
-    return sanitize_text_output(text)
+    # Notion always sets plain_text on rich text objects
+    text = "".join(map(_plain_text, rich_text))
+    return sanitize_text_output(text) if text else ""
+
+
+# Property type -> extractor taking the raw Notion property object
+_EXTRACTORS = {
+    "title": lambda prop: _extract_text_from_rich_text(prop.get("title", [])),
+    "rich_text": lambda prop: _extract_text_from_rich_text(prop.get("rich_text", [])),
+    "select": lambda prop: (prop.get("select") or {}).get("name"),
+    "multi_select": lambda prop: list(map(_option_name, prop.get("multi_select", []))),
+    "url": lambda prop: prop.get("url"),
+}
+
+# (CompText key, Notion property name, extractor) read by parse_page; the
+# extractors are resolved here once instead of per page
+_PAGE_PROPERTIES = tuple(
+    (key, prop_name, _EXTRACTORS[prop_type])
+    for key, prop_name, prop_type in (
+        ("titel", "Titel", "title"),
+        ("beschreibung", "Beschreibung", "rich_text"),
+        ("modul", "Modul", "select"),
+        ("typ", "Typ", "select"),
+        ("tags", "Tags", "multi_select"),
+    )
+)
+_EMPTY_PROPERTY: Dict[str, Any] = {}
 
 
 def _get_property_value(page: Dict, prop_name: str, prop_type: str) -> Any:
@@ -81,33 +335,19 @@ def _get_property_value(page: Dict, prop_name: str, prop_type: str) -> Any:
         prop_type: Type of the property (title, rich_text, select, multi_select, url)
 
     Returns:
-        Extracted value in appropriate Python type, or None if not found/error
+        Extracted value in appropriate Python type, or None for unknown types
     """
-    try:
-        prop = page["properties"].get(prop_name, {})
-
-        if prop_type == "title":
-            return _extract_text_from_rich_text(prop.get("title", []))
-        elif prop_type == "rich_text":
-            return _extract_text_from_rich_text(prop.get("rich_text", []))
-        elif prop_type == "select":
-            select_data = prop.get("select")
-            return select_data.get("name") if select_data else None
-        elif prop_type == "multi_select":
-            return [ms.get("name") for ms in prop.get("multi_select", [])]
-        elif prop_type == "url":
-            return prop.get("url")
-        else:
-            return None
-    except Exception as e:
-        logger.warning(f"Error extracting property {prop_name}: {e}")
-        return None
+    extractor = _EXTRACTORS.get(prop_type)
+    return extractor(page["properties"].get(prop_name, {})) if extractor else None
 
 
 def parse_page(page: Dict) -> Dict[str, Any]:
     """
     Parse Notion page to CompText format.
 
+    Results are memoized by (id, last_edited_time), so unchanged pages are
+    only parsed once.
+
     Args:
         page: Raw Notion page object
 
@@ -123,17 +363,68 @@ def parse_page(page: Dict) -> Dict[str, Any]:
         - created_time: Creation timestamp
         - last_edited_time: Last edit timestamp
     """
-    return {
-        "id": page["id"],
-        "url": page["url"],
-        "titel": _get_property_value(page, "Titel", "title"),
-        "beschreibung": _get_property_value(page, "Beschreibung", "rich_text"),
-        "modul": _get_property_value(page, "Modul", "select"),
-        "typ": _get_property_value(page, "Typ", "select"),
-        "tags": _get_property_value(page, "Tags", "multi_select"),
-        "created_time": page.get("created_time"),
-        "last_edited_time": page.get("last_edited_time"),
-    }
+    return _index_page(page).module
+
+
+def _index_page(page: Dict) -> _IndexedPage:
+    """Memoized parse_page result together with its search haystack, field length and character mask"""
+    key = (page["id"], page.get("last_edited_time"))
+    entry = _parsed_pages.get(key)
+    if entry is None:
+        parsed = _parse_page(page)
+        search_text = _search_text(parsed)
+        entry = _IndexedPage(
+            parsed,
+            search_text,
+            max(map(len, search_text.split(_FIELD_SEP))),
+            _char_mask(search_text),
+        )
+        if key[1] is not None:
+            if len(_parsed_pages) >= PARSED_PAGE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _parsed_pages[next(iter(_parsed_pages))]
+            _parsed_pages[key] = entry
+    return entry
+
+
+def _parse_page(page: Dict) -> Dict[str, Any]:
+    """Uncached body of parse_page"""
+    parsed = {"id": page["id"], "url": page["url"]}
+    try:
+        properties = page["properties"]
+        for key, prop_name, extractor in _PAGE_PROPERTIES:
+            parsed[key] = extractor(properties.get(prop_name, _EMPTY_PROPERTY))
+    except Exception as e:
+        logger.warning(f"Error extracting properties of page {page['id']}: {e}")
+        for key, _, _ in _PAGE_PROPERTIES:
+            parsed.setdefault(key, None)
+    parsed["created_time"] = page.get("created_time")
+    parsed["last_edited_time"] = page.get("last_edited_time")
+    return parsed
+
+
+def _rich_text_of(data: Dict) -> str:
+    """Plain text of a block's type-specific payload"""
+    return _extract_text_from_rich_text(data.get("rich_text", []))
+
+
+def _code_block_to_text(block: Dict) -> str:
+    """Fenced markdown code block tagged with the block's language"""
+    data = block["code"]
+    return f"```{data.get('language', '')}\n{_rich_text_of(data)}\n```"
+
+
+# Block type -> markdown formatter
+_BLOCK_FORMATTERS = {
+    "paragraph": lambda block: _rich_text_of(block["paragraph"]),
+    "heading_1": lambda block: f"# {_rich_text_of(block['heading_1'])}",
+    "heading_2": lambda block: f"## {_rich_text_of(block['heading_2'])}",
+    "heading_3": lambda block: f"### {_rich_text_of(block['heading_3'])}",
+    "bulleted_list_item": lambda block: f"- {_rich_text_of(block['bulleted_list_item'])}",
+    "numbered_list_item": lambda block: f"1. {_rich_text_of(block['numbered_list_item'])}",
+    "code": _code_block_to_text,
+    "quote": lambda block: f"> {_rich_text_of(block['quote'])}",
+}
 
 
 def _block_to_text(block: Dict) -> str:
@@ -146,50 +437,46 @@ def _block_to_text(block: Dict) -> str:
     Returns:
         Markdown-formatted text representation of the block
     """
-    block_type = block.get("type")
-
-    if block_type == "paragraph":
-        return _extract_text_from_rich_text(block["paragraph"].get("rich_text", []))
-    elif block_type == "heading_1":
-        return f"# {_extract_text_from_rich_text(block['heading_1'].get('rich_text', []))}"
-    elif block_type == "heading_2":
-        return f"## {_extract_text_from_rich_text(block['heading_2'].get('rich_text', []))}"
-    elif block_type == "heading_3":
-        return f"### {_extract_text_from_rich_text(block['heading_3'].get('rich_text', []))}"
-    elif block_type == "bulleted_list_item":
-        return f"- {_extract_text_from_rich_text(block['bulleted_list_item'].get('rich_text', []))}"
-    elif block_type == "numbered_list_item":
-        return f"1. {_extract_text_from_rich_text(block['numbered_list_item'].get('rich_text', []))}"
-    elif block_type == "code":
-        code = _extract_text_from_rich_text(block["code"].get("rich_text", []))
-        lang = block["code"].get("language", "")
-        return f"```{lang}\n{code}\n```"
-    elif block_type == "quote":
-        return f"> {_extract_text_from_rich_text(block['quote'].get('rich_text', []))}"
-    else:
-        return ""
+    formatter = _BLOCK_FORMATTERS.get(block.get("type"))
+    return formatter(block) if formatter else ""
 
 
-def blocks_to_text(blocks: List[Dict]) -> str:
+def blocks_to_text(blocks: Iterable[Dict]) -> str:
     """
-    Convert list of Notion blocks to markdown text.
+    Convert Notion blocks to markdown text.
+
+    Blocks are written to a buffer as they are converted, so no list of
+    per-block strings is held and any iterable of blocks can be streamed in.
 
     Args:
-        blocks: List of Notion block objects
+        blocks: Iterable of Notion block objects
 
     Returns:
         Markdown-formatted text with blocks separated by double newlines
     """
-    return "\n\n".join([_block_to_text(block) for block in blocks if _block_to_text(block)])
+    buffer = io.StringIO()
+    separator = ""
+    for text in map(_block_to_text, blocks):
+        if text:
+            buffer.write(separator)
+            buffer.write(text)
+            separator = "\n\n"
+    return buffer.getvalue()
 
 
-@lru_cache(maxsize=CACHE_SIZE)
 @retry_on_failure()
-def get_all_modules() -> List[Dict[str, Any]]:
+async def _fetch_all_modules() -> List[_IndexedPage]:
+    """Query the whole Codex database from Notion as indexed pages"""
+    return [_index_page(page) async for page in _query_all()]
+
+
+async def get_all_modules() -> List[Dict[str, Any]]:
     """
     Load all modules from CompText Codex.
 
-    Results are cached to improve performance. Use clear_cache() to invalidate.
+    Results are cached for MODULES_CACHE_TTL seconds (env COMPTEXT_CACHE_TTL,
+    default CACHE_TTL) and refreshed in the background shortly before they
+    expire. Use clear_cache() to invalidate.
     Automatically retries on Notion API failures with exponential backoff.
 
     Returns:
@@ -198,12 +485,69 @@ def get_all_modules() -> List[Dict[str, Any]]:
     Raises:
         NotionClientError: If all retry attempts fail
     """
-    response = notion.databases.query(database_id=CODEX_DB_ID)
-    return [parse_page(page) for page in response["results"]]
-
-
+    global _refresh_task
+    age = time.monotonic() - _modules_cached_at
+    if _modules_cache is None or age >= MODULES_CACHE_TTL:
+        filled_at = _modules_cached_at
+        async with _refresh_lock:
+            # Skip the fetch if another caller refilled the cache while we waited
+            if _modules_cached_at == filled_at:
+                await _refresh_modules()
+    elif age >= MODULES_CACHE_TTL * _REFRESH_AHEAD and (_refresh_task is None or _refresh_task.done()):
+        # Stale-while-revalidate: serve the cached list, refresh it off the request path
+        _refresh_task = asyncio.create_task(_refresh_modules_in_background())
+    return _modules_cache
+
+
+async def _refresh_modules() -> None:
+    """Reload the module cache, its search haystacks and its statistics from Notion"""
+    global _modules_cache, _modules_cached_at, _search_blob, _search_masks, _search_longest, _statistics
+    entries = await _fetch_all_modules()
+    modules = [entry.module for entry in entries]
+    _search_blob = [entry.search_text for entry in entries]
+    _search_masks = [entry.char_mask for entry in entries]
+    _search_longest = [entry.longest_field for entry in entries]
+    _statistics = compute_statistics(modules)
+    _modules_cache = modules
+    _modules_cached_at = time.monotonic()
+
+
+async def _refresh_modules_in_background() -> None:
+    """Refresh the module cache, keeping the current entries if Notion fails"""
+    try:
+        async with _refresh_lock:
+            await _refresh_modules()
+    except NotionClientError as e:
+        logger.warning(f"Background refresh of module cache failed: {e}")
+
+
+def _char_mask(text: str) -> int:
+    """Bitmask with bit n set for each ASCII character n in text; other characters are ignored"""
+    mask = 0
+    for char in set(text):
+        code = ord(char)
+        if code < 128:
+            mask |= 1 << code
+    return mask
+
+
+def _search_text(module: Dict[str, Any]) -> str:
+    """Build the lowercased haystack search_codex matches a module against"""
+    # Title comes first: the substring scan runs left to right, so the common
+    # title hit stops it before the longer description and tags are touched
+    return _FIELD_SEP.join(
+        (
+            (module.get("titel") or "").lower(),
+            (module.get("beschreibung") or "").lower(),
+            " ".join(module.get("tags") or ()).lower(),
+        )
+    )
+
+
+@_ttl_cached()
+@_single_flight
 @retry_on_failure()
-def get_module_by_name(modul_name: str) -> List[Dict[str, Any]]:
+async def get_module_by_name(modul_name: str) -> List[Dict[str, Any]]:
     """
     Load all entries of a specific module.
 
@@ -216,15 +560,19 @@ def get_module_by_name(modul_name: str) -> List[Dict[str, Any]]:
     Raises:
         NotionClientError: If all retry attempts fail
     """
-    response = notion.databases.query(database_id=CODEX_DB_ID, filter={"property": "Modul", "select": {"equals": modul_name}})
-    return [parse_page(page) for page in response["results"]]
+    return [parse_page(page) async for page in _query_all(filter={"property": "Modul", "select": {"equals": modul_name}})]
 
 
+@_single_flight
 @retry_on_failure()
-def get_page_content(page_id: str) -> str:
+async def get_page_content(page_id: str) -> str:
     """
     Load full content of a Notion page.
 
+    Rendered content is cached per page and reused while the page's
+    last_edited_time is unchanged, so a re-read costs one pages.retrieve call
+    instead of listing every block again.
+
     Args:
         page_id: Notion page ID (with or without dashes)
 
@@ -236,14 +584,34 @@ def get_page_content(page_id: str) -> str:
         NotionClientError: If all retry attempts fail
     """
     validated_id = validate_page_id(page_id)
-    blocks = notion.blocks.children.list(block_id=validated_id)
-    return blocks_to_text(blocks["results"])
-
-
-def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
+    page = await _run_blocking(notion.pages.retrieve, page_id=validated_id)
+    edited = page.get("last_edited_time")
+    cached = _page_content_cache.get(validated_id)
+    if cached is not None and edited is not None and cached[0] == edited:
+        return cached[1]
+
+    blocks = [block async for block in _paginate(notion.blocks.children.list, block_id=validated_id)]
+    content = blocks_to_text(blocks)
+    if edited is not None:
+        if validated_id not in _page_content_cache and len(_page_content_cache) >= CACHE_SIZE:
+            del _page_content_cache[next(iter(_page_content_cache))]
+        _page_content_cache[validated_id] = (edited, content)
+    return content
+
+
+async def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
     """
     Search in CompText Codex by title, description, or tags.
 
+    A warm module cache is scanned in memory; otherwise the filter runs on
+    Notion's side so only matching pages are transferred, falling back to
+    loading and scanning all modules if Notion rejects the filter.
+
+    Title and description match case-insensitive substrings either way. Tags
+    match by substring only on a warm cache: Notion's multi_select filter
+    compares whole tags, so a cold search matches a tag only when the query
+    equals it exactly.
+
     Args:
         query: Search query string (max 200 characters)
         max_results: Maximum number of results to return (default: 20)
@@ -256,16 +624,25 @@ def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
         NotionClientError: If fetching modules fails
     """
     validated_query = validate_query_string(query)
-    all_modules = get_all_modules()
+    if max_results <= 0:
+        return []
+    if _modules_cache is None or time.monotonic() - _modules_cached_at >= MODULES_CACHE_TTL:
+        try:
+            return await _search_notion(validated_query, max_results)
+        except NotionClientError as e:
+            logger.warning(f"Notion rejected search filter, scanning all modules instead: {e}")
+
+    all_modules = await get_all_modules()
     query_lower = validated_query.lower()
-
+    query_length = len(query_lower)
+    query_mask = _char_mask(query_lower)
     results = []
-    for module in all_modules:
-        titel = (module.get("titel") or "").lower()
-        beschreibung = (module.get("beschreibung") or "").lower()
-        tags = " ".join(module.get("tags", [])).lower()
-
-        if query_lower in titel or query_lower in beschreibung or query_lower in tags:
+    for module, blob, mask, longest in zip(all_modules, _search_blob, _search_masks, _search_longest):
+        # An entry whose fields are all shorter than the query, or that misses
+        # any ASCII character of it, cannot contain it
+        if query_length > longest or mask & query_mask != query_mask:
+            continue
+        if query_lower in blob:
             results.append(module)
 
             if len(results) >= max_results:
@@ -274,8 +651,32 @@ def search_codex(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
     return results
 
 
+@_single_flight
+@retry_on_failure()
+async def _search_notion(query: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run search_codex's title/description/tag match as a Notion query filter"""
+    pages = _query_all(
+        filter={
+            "or": [
+                {"property": "Titel", "title": {"contains": query}},
+                {"property": "Beschreibung", "rich_text": {"contains": query}},
+                {"property": "Tags", "multi_select": {"contains": query}},
+            ]
+        },
+        page_size=min(max_results, NOTION_PAGE_SIZE),
+    )
+    results = []
+    async with aclosing(pages):
+        async for page in pages:
+            results.append(parse_page(page))
+            if len(results) >= max_results:
+                break
+    return results
+
+
+@_single_flight
 @retry_on_failure()
-def get_page_by_id(page_id: str) -> Dict[str, Any]:
+async def get_page_by_id(page_id: str) -> Dict[str, Any]:
     """
     Get page information by Notion page ID.
 
@@ -290,12 +691,14 @@ def get_page_by_id(page_id: str) -> Dict[str, Any]:
         NotionClientError: If all retry attempts fail
     """
     validated_id = validate_page_id(page_id)
-    page = notion.pages.retrieve(page_id=validated_id)
+    page = await _run_blocking(notion.pages.retrieve, page_id=validated_id)
     return parse_page(page)
 
 
+@_ttl_cached()
+@_single_flight
 @retry_on_failure()
-def get_modules_by_tag(tag: str) -> List[Dict[str, Any]]:
+async def get_modules_by_tag(tag: str) -> List[Dict[str, Any]]:
     """
     Filter modules by tag.
 
@@ -308,12 +711,13 @@ def get_modules_by_tag(tag: str) -> List[Dict[str, Any]]:
     Raises:
         NotionClientError: If all retry attempts fail
     """
-    response = notion.databases.query(database_id=CODEX_DB_ID, filter={"property": "Tags", "multi_select": {"contains": tag}})
-    return [parse_page(page) for page in response["results"]]
+    return [parse_page(page) async for page in _query_all(filter={"property": "Tags", "multi_select": {"contains": tag}})]
 
 
+@_ttl_cached()
+@_single_flight
 @retry_on_failure()
-def get_modules_by_type(typ: str) -> List[Dict[str, Any]]:
+async def get_modules_by_type(typ: str) -> List[Dict[str, Any]]:
     """
     Filter modules by type.
 
@@ -326,15 +730,77 @@ def get_modules_by_type(typ: str) -> List[Dict[str, Any]]:
     Raises:
         NotionClientError: If all retry attempts fail
     """
-    response = notion.databases.query(database_id=CODEX_DB_ID, filter={"property": "Typ", "select": {"equals": typ}})
-    return [parse_page(page) for page in response["results"]]
+    return [parse_page(page) async for page in _query_all(filter={"property": "Typ", "select": {"equals": typ}})]
+
+
+async def get_statistics() -> Dict[str, Any]:
+    """
+    Count Codex entries by module, type and tag.
+
+    Counts are computed once per fill of the get_all_modules cache and
+    shared by every caller until the next refill.
+
+    Returns:
+        Dictionary with total_entries and by_module/by_type/by_tag counts
+
+    Raises:
+        NotionClientError: If loading the modules fails
+    """
+    await get_all_modules()
+    return _statistics
+
+
+async def get_modules_multi(
+    *, modul: Optional[str] = None, tag: Optional[str] = None, typ: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load the entries matching any of the given filters, querying Notion concurrently.
+
+    Args:
+        modul: Full module name, as for get_module_by_name
+        tag: Tag name, as for get_modules_by_tag
+        typ: Type name, as for get_modules_by_type
+
+    Returns:
+        Entries matching at least one filter, deduplicated by ID
+
+    Raises:
+        NotionClientError: If any of the queries fails
+    """
+    queries = []
+    if modul is not None:
+        queries.append(get_module_by_name(modul))
+    if tag is not None:
+        queries.append(get_modules_by_tag(tag))
+    if typ is not None:
+        queries.append(get_modules_by_type(typ))
+
+    # Let every query finish before surfacing a failure, so none is left running
+    responses = await asyncio.gather(*queries, return_exceptions=True)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for response in responses:
+        if isinstance(response, BaseException):
+            raise response
+        for entry in response:
+            entries.setdefault(entry["id"], entry)
+    return list(entries.values())
 
 
 def clear_cache():
     """
-    Clear the LRU cache for get_all_modules.
+    Clear the get_all_modules, get_page_content and filter query caches and the parsed-page memo.
 
     Use this to force a refresh of cached data from Notion.
     """
-    get_all_modules.cache_clear()
+    global _modules_cache, _search_blob, _search_masks, _search_longest, _statistics
+    _modules_cache = None
+    _statistics = None
+    _search_blob = []
+    _search_masks = []
+    _search_longest = []
+    _parsed_pages.clear()
+    _page_content_cache.clear()
+    for cache in _query_caches:
+        cache.clear()
     logger.info("Cache cleared")
@@ -1,42 +1,14 @@
 """CompText MCP Server - Production Ready"""
 
 import asyncio
+import inspect
 import logging
 import os
-from typing import Any, Sequence, List
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Sequence, List, Type
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
-from dotenv import load_dotenv
-
-# Load environment first
-load_dotenv()
-
-# Determine data source
-DATA_SOURCE = os.getenv("COMPTEXT_DATA_SOURCE", "local").lower()
-
-# Import appropriate client based on configuration
-if DATA_SOURCE == "notion":
-    from .notion_client import (
-        get_all_modules,
-        get_module_by_name,
-        get_page_content,
-        search_codex,
-        get_modules_by_tag,
-        get_modules_by_type,
-        NotionClientError as CodexClientError,
-    )
-    logger_msg = "Using Notion API as data source"
-else:
-    from .local_codex_client import (
-        get_all_modules,
-        get_module_by_name,
-        get_page_content,
-        search_codex,
-        get_modules_by_tag,
-        get_modules_by_type,
-        LocalCodexClientError as CodexClientError,
-    )
-    logger_msg = "Using local JSON file as data source"
 
 from .github_client import (
     audit_repository,
@@ -44,7 +16,7 @@ from .github_client import (
     generate_default_branch_commands,
     GitHubClientError,
 )
-from .constants import MODULE_MAP, DEFAULT_MAX_RESULTS
+from .constants import MODULE_MAP, DEFAULT_MAX_RESULTS, MAX_BATCH_CALLS, MAX_CONCURRENT_BATCH_CALLS
 from .utils import (
     validate_page_id,
     validate_query_string,
@@ -56,7 +28,6 @@ from .utils import (
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-logger.info(logger_msg)
 
 # Constants
 MAX_BRANCHES_TO_DISPLAY = 10
@@ -65,418 +36,567 @@ MAX_BRANCHES_TO_DISPLAY = 10
 server = Server("comptext-codex")
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available CompText tools"""
-    return [
-        Tool(
-            name="list_modules",
-            description="Liste alle CompText-Module (A-M) mit Zusammenfassung auf",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="get_module",
-            description="Lade ein spezifisches Modul mit allen Einträgen (A-M)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "module": {
-                        "type": "string",
-                        "description": "Modul-Buchstabe (A-M) oder vollständiger Name",
-                        "enum": list(MODULE_MAP.keys()) + list(MODULE_MAP.values()),
-                    }
-                },
-                "required": ["module"],
+class _Settings(NamedTuple):
+    """Data source selected from the environment"""
+
+    data_source: str
+    codex: ModuleType
+    client_error: Type[Exception]
+
+
+@lru_cache(maxsize=1)
+def _settings() -> _Settings:
+    """Load .env and import the codex client named by COMPTEXT_DATA_SOURCE"""
+    from dotenv import load_dotenv
+
+    # The clients read their configuration at import, so .env is loaded first
+    load_dotenv()
+    data_source = os.getenv("COMPTEXT_DATA_SOURCE", "local").lower()
+    if data_source == "notion":
+        from . import notion_client as codex
+
+        client_error = codex.NotionClientError
+        logger.info("Using Notion API as data source")
+    else:
+        from . import local_codex_client as codex
+
+        client_error = codex.LocalCodexClientError
+        logger.info("Using local JSON file as data source")
+    return _Settings(data_source, codex, client_error)
+
+
+async def _codex(name: str, *args) -> Any:
+    """Call a codex client function; the Notion client is async, the local client is not"""
+    result = getattr(_settings().codex, name)(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+# Module selector accepted by get_module: letters (A-M) and full names
+_MODULE_ENUM = list(MODULE_MAP.keys()) + list(MODULE_MAP.values())
+
+# (full module name, list_modules section heading), formatted once at import
+_MODULE_HEADERS = [(full_name, f"## {letter}: {full_name}\nEinträge: ") for letter, full_name in MODULE_MAP.items()]
+
+# Tool definitions are static, so they are built once at import
+_TOOLS = [
+    Tool(
+        name="list_modules",
+        description="Liste alle CompText-Module (A-M) mit Zusammenfassung auf",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="get_module",
+        description="Lade ein spezifisches Modul mit allen Einträgen (A-M)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "module": {
+                    "type": "string",
+                    "description": "Modul-Buchstabe (A-M) oder vollständiger Name",
+                    "enum": _MODULE_ENUM,
+                }
             },
-        ),
-        Tool(
-            name="get_command",
-            description="Lade den vollständigen Inhalt eines Befehls/einer Seite",
-            inputSchema={
-                "type": "object",
-                "properties": {"page_id": {"type": "string", "description": "Notion Page-ID"}},
-                "required": ["page_id"],
+            "required": ["module"],
+        },
+    ),
+    Tool(
+        name="get_command",
+        description="Lade den vollständigen Inhalt eines Befehls/einer Seite",
+        inputSchema={
+            "type": "object",
+            "properties": {"page_id": {"type": "string", "description": "Notion Page-ID"}},
+            "required": ["page_id"],
+        },
+    ),
+    Tool(
+        name="search",
+        description="Durchsuche den CompText-Codex nach Befehlen, Beispielen oder Dokumentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Suchbegriff"},
+                "max_results": {"type": "integer", "description": "Maximale Anzahl Ergebnisse", "default": 20},
             },
-        ),
-        Tool(
-            name="search",
-            description="Durchsuche den CompText-Codex nach Befehlen, Beispielen oder Dokumentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Suchbegriff"},
-                    "max_results": {"type": "integer", "description": "Maximale Anzahl Ergebnisse", "default": 20},
-                },
-                "required": ["query"],
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_by_tag",
+        description="Filtere Einträge nach Tag (Core, Erweitert, Optimierung, Visualisierung, Analyse)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tag": {
+                    "type": "string",
+                    "description": "Tag-Name",
+                    "enum": ["Core", "Erweitert", "Optimierung", "Visualisierung", "Analyse"],
+                }
             },
-        ),
-        Tool(
-            name="get_by_tag",
-            description="Filtere Einträge nach Tag (Core, Erweitert, Optimierung, Visualisierung, Analyse)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tag": {
-                        "type": "string",
-                        "description": "Tag-Name",
-                        "enum": ["Core", "Erweitert", "Optimierung", "Visualisierung", "Analyse"],
-                    }
-                },
-                "required": ["tag"],
+            "required": ["tag"],
+        },
+    ),
+    Tool(
+        name="get_by_type",
+        description="Filtere Einträge nach Typ (Dokumentation, Beispiel, Test, Referenz)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {
+                    "type": "string",
+                    "description": "Typ-Name",
+                    "enum": ["Dokumentation", "Beispiel", "Test", "Referenz"],
+                }
             },
-        ),
-        Tool(
-            name="get_by_type",
-            description="Filtere Einträge nach Typ (Dokumentation, Beispiel, Test, Referenz)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {
-                        "type": "string",
-                        "description": "Typ-Name",
-                        "enum": ["Dokumentation", "Beispiel", "Test", "Referenz"],
-                    }
-                },
-                "required": ["type"],
+            "required": ["type"],
+        },
+    ),
+    Tool(
+        name="get_statistics",
+        description="Zeige Statistiken über den CompText-Codex",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="github_audit",
+        description="Audit eines GitHub-Repositories: Default-Branch, alle Branches mit letztem Commit, offene PRs, Draft-Status und Mergeable-State",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "owner": {"type": "string", "description": "Repository-Owner (z.B. ProfRandom92)"},
+                "repo": {"type": "string", "description": "Repository-Name (z.B. comptext-mcp-server)"},
             },
-        ),
-        Tool(
-            name="get_statistics",
-            description="Zeige Statistiken über den CompText-Codex",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="github_audit",
-            description="Audit eines GitHub-Repositories: Default-Branch, alle Branches mit letztem Commit, offene PRs, Draft-Status und Mergeable-State",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository-Owner (z.B. ProfRandom92)"},
-                    "repo": {"type": "string", "description": "Repository-Name (z.B. comptext-mcp-server)"},
+            "required": ["owner", "repo"],
+        },
+    ),
+    Tool(
+        name="github_auto_merge",
+        description="Automatisches Mergen aller nicht-draft PRs (squash & merge) von ältesten zu neuesten, inkl. Dependabot",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "owner": {"type": "string", "description": "Repository-Owner"},
+                "repo": {"type": "string", "description": "Repository-Name"},
+                "merge_method": {
+                    "type": "string",
+                    "description": "Merge-Methode",
+                    "enum": ["squash", "merge", "rebase"],
+                    "default": "squash"
                 },
-                "required": ["owner", "repo"],
             },
-        ),
-        Tool(
-            name="github_auto_merge",
-            description="Automatisches Mergen aller nicht-draft PRs (squash & merge) von ältesten zu neuesten, inkl. Dependabot",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository-Owner"},
-                    "repo": {"type": "string", "description": "Repository-Name"},
-                    "merge_method": {
-                        "type": "string",
-                        "description": "Merge-Methode",
-                        "enum": ["squash", "merge", "rebase"],
-                        "default": "squash"
-                    },
-                },
-                "required": ["owner", "repo"],
+            "required": ["owner", "repo"],
+        },
+    ),
+    Tool(
+        name="github_default_branch_commands",
+        description="Generiere Befehle zum manuellen Ändern des Default-Branch (gh CLI, curl, Web-UI)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "owner": {"type": "string", "description": "Repository-Owner"},
+                "repo": {"type": "string", "description": "Repository-Name"},
+                "new_default": {"type": "string", "description": "Neuer Default-Branch Name"},
             },
-        ),
-        Tool(
-            name="github_default_branch_commands",
-            description="Generiere Befehle zum manuellen Ändern des Default-Branch (gh CLI, curl, Web-UI)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "owner": {"type": "string", "description": "Repository-Owner"},
-                    "repo": {"type": "string", "description": "Repository-Name"},
-                    "new_default": {"type": "string", "description": "Neuer Default-Branch Name"},
-                },
-                "required": ["owner", "repo", "new_default"],
+            "required": ["owner", "repo", "new_default"],
+        },
+    ),
+    Tool(
+        name="nl_to_comptext",
+        description="Konvertiere Natural Language in kanonisches CompText (Bundle-first)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Natural language request"},
+                "audience": {"type": "string", "enum": ["dev", "audit", "exec"], "default": "dev"},
+                "mode": {"type": "string", "enum": ["bundle_only", "allow_inline_fallback"], "default": "bundle_only"},
+                "return": {"type": "string", "enum": ["dsl_only", "dsl_plus_confidence", "dsl_plus_explanation"], "default": "dsl_plus_confidence"},
             },
-        ),
-        Tool(
-            name="nl_to_comptext",
-            description="Konvertiere Natural Language in kanonisches CompText (Bundle-first)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Natural language request"},
-                    "audience": {"type": "string", "enum": ["dev", "audit", "exec"], "default": "dev"},
-                    "mode": {"type": "string", "enum": ["bundle_only", "allow_inline_fallback"], "default": "bundle_only"},
-                    "return": {"type": "string", "enum": ["dsl_only", "dsl_plus_confidence", "dsl_plus_explanation"], "default": "dsl_plus_confidence"},
-                },
-                "required": ["text"],
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="batch_execute",
+        description="Führe mehrere lesende Tool-Aufrufe in einem Request parallel aus (ohne github_auto_merge)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool-Aufrufe, die ausgeführt werden sollen",
+                    "maxItems": MAX_BATCH_CALLS,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Name des Tools"},
+                            "arguments": {"type": "object", "description": "Argumente des Tools", "default": {}},
+                        },
+                        "required": ["name"],
+                    },
+                }
             },
+            "required": ["calls"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available CompText tools"""
+    return _TOOLS
+
+
+async def _handle_list_modules(arguments: Any) -> List[TextContent]:
+    """Handle the list_modules tool"""
+    # Per-module counts come from the shared statistics instead of regrouping all entries
+    stats = await _codex("get_statistics")
+    by_module = stats["by_module"]
+
+    # Format output
+    parts = ["# CompText Module Übersicht\n\n"]
+    for full_name, header in _MODULE_HEADERS:
+        parts.append(f"{header}{by_module.get(full_name, 0)}\n\n")
+
+    parts.append(f"\n**Gesamt:** {stats['total_entries']} Einträge")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_get_module(arguments: Any) -> List[TextContent]:
+    """Handle the get_module tool"""
+    module = arguments.get("module")
+
+    # Convert letter to full name
+    if module in MODULE_MAP:
+        module = MODULE_MAP[module]
+
+    entries = await _codex("get_module_by_name", module)
+
+    # Format output
+    parts = [
+        f"# {module}\n\n",
+        f"**Anzahl Einträge:** {len(entries)}\n\n",
+    ]
+
+    for entry in entries:
+        parts.append(f"### {entry['titel']}\n")
+        if entry.get("beschreibung"):
+            parts.append(f"{truncate_text(entry['beschreibung'], max_length=320)}\n")
+        parts.append(f"- **Typ:** {entry.get('typ', 'N/A')}\n")
+        parts.append(f"- **Tags:** {', '.join(entry.get('tags', []))}\n")
+        parts.append(f"- **ID:** {entry['id']}\n")
+        parts.append(f"- **URL:** {entry['url']}\n\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_get_command(arguments: Any) -> List[TextContent]:
+    """Handle the get_command tool"""
+    page_id = arguments.get("page_id")
+    # For local codex, don't validate UUID format as IDs are custom
+    if _settings().data_source != "local":
+        page_id = validate_page_id(page_id)
+    content = await _codex("get_page_content", page_id)
+
+    return [TextContent(type="text", text=truncate_text(content, max_length=4000))]
+
+
+async def _handle_search(arguments: Any) -> List[TextContent]:
+    """Handle the search tool"""
+    query = validate_query_string(arguments.get("query"))
+    max_results = arguments.get("max_results", DEFAULT_MAX_RESULTS)
+
+    results = await _codex("search_codex", query, max_results)
+
+    parts = [
+        f"# Suchergebnisse für: {query}\n\n",
+        f"**Gefunden:** {len(results)} Ergebnisse\n\n",
+    ]
+
+    for result in results:
+        beschreibung = result.get("beschreibung")
+        description = f"{truncate_text(beschreibung, max_length=320)}\n" if beschreibung else ""
+        # Adjacent f-strings compile to a single format operation per result
+        parts.append(
+            f"### {result['titel']}\n"
+            f"{description}"
+            f"- **Modul:** {result.get('modul', 'N/A')}\n"
+            f"- **Typ:** {result.get('typ', 'N/A')}\n"
+            f"- **Tags:** {', '.join(result.get('tags', []))}\n"
+            f"- **ID:** {result['id']}\n\n"
         )
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_get_by_tag(arguments: Any) -> List[TextContent]:
+    """Handle the get_by_tag tool"""
+    tag = arguments.get("tag")
+    results = await _codex("get_modules_by_tag", tag)
+
+    parts = [
+        f"# Einträge mit Tag: {tag}\n\n",
+        f"**Anzahl:** {len(results)}\n\n",
     ]
 
+    for result in results:
+        parts.append(f"### {result['titel']}\n")
+        parts.append(f"- **Modul:** {result.get('modul', 'N/A')}\n")
+        parts.append(f"- **Typ:** {result.get('typ', 'N/A')}\n\n")
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-    """Handle tool calls"""
-    try:
-        if name == "list_modules":
-            modules = get_all_modules()
+    return [TextContent(type="text", text="".join(parts))]
 
-            # Group by module
-            by_module = {}
-            for entry in modules:
-                modul = entry.get("modul")
-                if modul:
-                    by_module.setdefault(modul, []).append(entry)
 
-            # Format output
-            output = "# CompText Module Übersicht\n\n"
-            for letter, full_name in MODULE_MAP.items():
-                entries = by_module.get(full_name, [])
-                output += f"## {letter}: {full_name}\n"
-                output += f"Einträge: {len(entries)}\n\n"
+async def _handle_get_by_type(arguments: Any) -> List[TextContent]:
+    """Handle the get_by_type tool"""
+    typ = arguments.get("type")
+    results = await _codex("get_modules_by_type", typ)
 
-            output += f"\n**Gesamt:** {len(modules)} Einträge"
+    parts = [
+        f"# Einträge vom Typ: {typ}\n\n",
+        f"**Anzahl:** {len(results)}\n\n",
+    ]
 
-            return [TextContent(type="text", text=output)]
+    for result in results:
+        parts.append(f"### {result['titel']}\n")
+        parts.append(f"- **Modul:** {result.get('modul', 'N/A')}\n")
+        parts.append(f"- **Tags:** {', '.join(result.get('tags', []))}\n\n")
 
-        elif name == "get_module":
-            module = arguments.get("module")
-
-            # Convert letter to full name
-            if module in MODULE_MAP:
-                module = MODULE_MAP[module]
-
-            entries = get_module_by_name(module)
+    return [TextContent(type="text", text="".join(parts))]
 
-            # Format output
-            output = f"# {module}\n\n"
-            output += f"**Anzahl Einträge:** {len(entries)}\n\n"
 
-            for entry in entries:
-                output += f"### {entry['titel']}\n"
-                if entry.get("beschreibung"):
-                    output += f"{truncate_text(entry['beschreibung'], max_length=320)}\n"
-                output += f"- **Typ:** {entry.get('typ', 'N/A')}\n"
-                output += f"- **Tags:** {', '.join(entry.get('tags', []))}\n"
-                output += f"- **ID:** {entry['id']}\n"
-                output += f"- **URL:** {entry['url']}\n\n"
+async def _handle_get_statistics(arguments: Any) -> List[TextContent]:
+    """Handle the get_statistics tool"""
+    stats = await _codex("get_statistics")
+
+    # Format output
+    parts = [
+        "# CompText-Codex Statistiken\n\n",
+        f"**Gesamt Einträge:** {stats['total_entries']}\n\n",
+    ]
 
-            return [TextContent(type="text", text=output)]
+    parts.append("## Nach Modul\n")
+    for modul, count in sorted(stats["by_module"].items()):
+        parts.append(f"- {modul}: {count}\n")
 
-        elif name == "get_command":
-            page_id = arguments.get("page_id")
-            # For local codex, don't validate UUID format as IDs are custom
-            if DATA_SOURCE != "local":
-                page_id = validate_page_id(page_id)
-            content = get_page_content(page_id)
-
-            return [TextContent(type="text", text=truncate_text(content, max_length=4000))]
-
-        elif name == "search":
-            query = validate_query_string(arguments.get("query"))
-            max_results = arguments.get("max_results", DEFAULT_MAX_RESULTS)
-
-            results = search_codex(query, max_results)
-
-            output = f"# Suchergebnisse für: {query}\n\n"
-            output += f"**Gefunden:** {len(results)} Ergebnisse\n\n"
-
-            for result in results:
-                output += f"### {result['titel']}\n"
-                if result.get("beschreibung"):
-                    output += f"{truncate_text(result['beschreibung'], max_length=320)}\n"
-                output += f"- **Modul:** {result.get('modul', 'N/A')}\n"
-                output += f"- **Typ:** {result.get('typ', 'N/A')}\n"
-                output += f"- **Tags:** {', '.join(result.get('tags', []))}\n"
-                output += f"- **ID:** {result['id']}\n\n"
-
-            return [TextContent(type="text", text=output)]
-
-        elif name == "get_by_tag":
-            tag = arguments.get("tag")
-            results = get_modules_by_tag(tag)
-
-            output = f"# Einträge mit Tag: {tag}\n\n"
-            output += f"**Anzahl:** {len(results)}\n\n"
-
-            for result in results:
-                output += f"### {result['titel']}\n"
-                output += f"- **Modul:** {result.get('modul', 'N/A')}\n"
-                output += f"- **Typ:** {result.get('typ', 'N/A')}\n\n"
-
-            return [TextContent(type="text", text=output)]
-
-        elif name == "get_by_type":
-            typ = arguments.get("type")
-            results = get_modules_by_type(typ)
-
-            output = f"# Einträge vom Typ: {typ}\n\n"
-            output += f"**Anzahl:** {len(results)}\n\n"
-
-            for result in results:
-                output += f"### {result['titel']}\n"
-                output += f"- **Modul:** {result.get('modul', 'N/A')}\n"
-                output += f"- **Tags:** {', '.join(result.get('tags', []))}\n\n"
-
-            return [TextContent(type="text", text=output)]
-
-        elif name == "get_statistics":
-            modules = get_all_modules()
-
-            # Calculate statistics
-            by_module = {}
-            by_type = {}
-            by_tag = {}
-
-            for entry in modules:
-                # By module
-                modul = entry.get("modul")
-                if modul:
-                    by_module[modul] = by_module.get(modul, 0) + 1
-
-                # By type
-                typ = entry.get("typ")
-                if typ:
-                    by_type[typ] = by_type.get(typ, 0) + 1
-
-                # By tag
-                for tag in entry.get("tags", []):
-                    by_tag[tag] = by_tag.get(tag, 0) + 1
-
-            # Format output
-            output = "# CompText-Codex Statistiken\n\n"
-            output += f"**Gesamt Einträge:** {len(modules)}\n\n"
-
-            output += "## Nach Modul\n"
-            for modul, count in sorted(by_module.items()):
-                output += f"- {modul}: {count}\n"
-
-            output += "\n## Nach Typ\n"
-            for typ, count in sorted(by_type.items()):
-                output += f"- {typ}: {count}\n"
-
-            output += "\n## Nach Tags\n"
-            for tag, count in sorted(by_tag.items()):
-                output += f"- {tag}: {count}\n"
-
-            return [TextContent(type="text", text=output)]
-
-        elif name == "github_audit":
-            owner = validate_github_repo_name(arguments.get("owner", ""))
-            repo = validate_github_repo_name(arguments.get("repo", ""))
-            
-            audit = audit_repository(owner, repo)
-            
-            # Format output
-            output = f"# GitHub Repository Audit: {owner}/{repo}\n\n"
-            output += f"**Default Branch:** {audit['default_branch']}\n"
-            output += f"**Total Branches:** {audit['total_branches']}\n"
-            output += f"**Total Open PRs:** {audit['total_open_prs']}\n"
-            output += f"**Mergeable PRs:** {audit['mergeable_prs']}\n"
-            output += f"**Draft PRs:** {audit['draft_prs']}\n\n"
-            
-            # Branches with last commit (show top N)
-            output += "## Branches (sorted by last commit, newest first)\n\n"
-            for branch in audit['branches'][:MAX_BRANCHES_TO_DISPLAY]:
-                commit = branch['last_commit']
-                output += f"### {branch['name']}\n"
-                output += f"- **Last Commit:** {commit['date']}\n"
-                output += f"- **Author:** {commit['author']}\n"
-                output += f"- **Message:** {commit['message']}\n"
-                output += f"- **SHA:** {commit['sha'][:7]}\n\n"
-            
-            if audit['total_branches'] > MAX_BRANCHES_TO_DISPLAY:
-                output += f"_(showing {MAX_BRANCHES_TO_DISPLAY} of {audit['total_branches']} branches)_\n\n"
-            
-            # Open PRs
-            output += "## Open Pull Requests\n\n"
-            if audit['open_prs']:
-                for pr in audit['open_prs']:
-                    output += f"### PR #{pr['number']}: {pr['title']}\n"
-                    output += f"- **Author:** {pr['author']}\n"
-                    output += f"- **Created:** {pr['created_at']}\n"
-                    output += f"- **Draft:** {'Yes' if pr['draft'] else 'No'}\n"
-                    output += f"- **Mergeable:** {pr['mergeable']}\n"
-                    output += f"- **State:** {pr['mergeable_state']}\n"
-                    output += f"- **Branch:** {pr['head_branch']} → {pr['base_branch']}\n"
-                    output += f"- **Dependabot:** {'Yes' if pr['is_dependabot'] else 'No'}\n"
-                    output += f"- **URL:** {pr['url']}\n\n"
-            else:
-                output += "No open pull requests.\n"
-            
-            return [TextContent(type="text", text=output)]
-
-        elif name == "github_auto_merge":
-            owner = validate_github_repo_name(arguments.get("owner", ""))
-            repo = validate_github_repo_name(arguments.get("repo", ""))
-            merge_method = arguments.get("merge_method", "squash")
-            
-            results = auto_merge_prs(owner, repo, merge_method=merge_method)
-            
-            # Format output
-            output = f"# Auto-Merge Results: {owner}/{repo}\n\n"
-            output += f"**Total PRs Processed:** {results['total_prs']}\n"
-            output += f"**Merge Method:** {results['merge_method']}\n"
-            output += f"**Successful Merges:** {results['successful_merges']}\n"
-            output += f"**Failed Merges:** {results['failed_merges']}\n"
-            output += f"**Skipped Drafts:** {results['skipped_drafts']}\n\n"
-            
-            if results.get('stopped_early'):
-                output += f"⚠️ **Stopped Early:** {results['stop_reason']}\n\n"
-            
-            output += "## Detailed Results\n\n"
-            for result in results['results']:
-                status = "✓" if result['success'] else "✗"
-                output += f"{status} **PR #{result['pr_number']}:** {result['pr_title']}\n"
-                output += f"   - **Author:** {result['pr_author']}\n"
-                
-                if result['success']:
-                    output += f"   - **Status:** Merged successfully\n"
-                    if 'sha' in result:
-                        output += f"   - **Commit SHA:** {result['sha'][:7]}\n"
-                else:
-                    output += f"   - **Status:** {result['reason']}\n"
-                    output += f"   - **Message:** {result['message']}\n"
-                
-                output += "\n"
-            
-            return [TextContent(type="text", text=output)]
-
-        elif name == "github_default_branch_commands":
-            owner = validate_github_repo_name(arguments.get("owner", ""))
-            repo = validate_github_repo_name(arguments.get("repo", ""))
-            new_default = validate_branch_name(arguments.get("new_default", ""))
-            
-            commands = generate_default_branch_commands(owner, repo, new_default)
-            
-            # Format output
-            output = f"# Change Default Branch: {owner}/{repo} → {new_default}\n\n"
-            output += f"**Note:** {commands['note']}\n\n"
-            
-            output += "## Using GitHub CLI (gh)\n\n"
-            output += "```bash\n"
-            output += commands['commands']['gh_cli']
-            output += "\n```\n\n"
-            
-            output += "## Using curl\n\n"
-            output += "```bash\n"
-            output += commands['commands']['curl']
-            output += "\n```\n\n"
-            
-            output += "## Using Web UI\n\n"
-            output += commands['commands']['web_ui']
-            output += "\n"
-            
-            return [TextContent(type="text", text=output)]
-
-        elif name == "nl_to_comptext":
-            from .compiler.nl_to_comptext import compile_nl_to_comptext
-            result = compile_nl_to_comptext(
-                text=arguments.get("text", ""),
-                audience=arguments.get("audience", "dev"),
-                mode=arguments.get("mode", "bundle_only"),
-                return_mode=arguments.get("return", "dsl_plus_confidence"),
-            )
-            return [TextContent(type="text", text=result)]
+    parts.append("\n## Nach Typ\n")
+    for typ, count in sorted(stats["by_type"].items()):
+        parts.append(f"- {typ}: {count}\n")
 
+    parts.append("\n## Nach Tags\n")
+    for tag, count in sorted(stats["by_tag"].items()):
+        parts.append(f"- {tag}: {count}\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_github_audit(arguments: Any) -> List[TextContent]:
+    """Handle the github_audit tool"""
+    owner = validate_github_repo_name(arguments.get("owner", ""))
+    repo = validate_github_repo_name(arguments.get("repo", ""))
+
+    # PyGithub blocks on HTTP; run it off the event loop so batched calls overlap
+    audit = await asyncio.to_thread(audit_repository, owner, repo)
+
+    # Format output
+    parts = [
+        f"# GitHub Repository Audit: {owner}/{repo}\n\n",
+        f"**Default Branch:** {audit['default_branch']}\n",
+        f"**Total Branches:** {audit['total_branches']}\n",
+        f"**Total Open PRs:** {audit['total_open_prs']}\n",
+        f"**Mergeable PRs:** {audit['mergeable_prs']}\n",
+        f"**Draft PRs:** {audit['draft_prs']}\n\n",
+    ]
+
+    # Branches with last commit (show top N)
+    parts.append("## Branches (sorted by last commit, newest first)\n\n")
+    for branch in audit['branches'][:MAX_BRANCHES_TO_DISPLAY]:
+        commit = branch['last_commit']
+        parts.append(f"### {branch['name']}\n")
+        parts.append(f"- **Last Commit:** {commit['date']}\n")
+        parts.append(f"- **Author:** {commit['author']}\n")
+        parts.append(f"- **Message:** {commit['message']}\n")
+        parts.append(f"- **SHA:** {commit['sha'][:7]}\n\n")
+
+    if audit['total_branches'] > MAX_BRANCHES_TO_DISPLAY:
+        parts.append(f"_(showing {MAX_BRANCHES_TO_DISPLAY} of {audit['total_branches']} branches)_\n\n")
+
+    # Open PRs
+    parts.append("## Open Pull Requests\n\n")
+    if audit['open_prs']:
+        for pr in audit['open_prs']:
+            parts.append(f"### PR #{pr['number']}: {pr['title']}\n")
+            parts.append(f"- **Author:** {pr['author']}\n")
+            parts.append(f"- **Created:** {pr['created_at']}\n")
+            parts.append(f"- **Draft:** {'Yes' if pr['draft'] else 'No'}\n")
+            parts.append(f"- **Mergeable:** {pr['mergeable']}\n")
+            parts.append(f"- **State:** {pr['mergeable_state']}\n")
+            parts.append(f"- **Branch:** {pr['head_branch']} → {pr['base_branch']}\n")
+            parts.append(f"- **Dependabot:** {'Yes' if pr['is_dependabot'] else 'No'}\n")
+            parts.append(f"- **URL:** {pr['url']}\n\n")
+    else:
+        parts.append("No open pull requests.\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_github_auto_merge(arguments: Any) -> List[TextContent]:
+    """Handle the github_auto_merge tool"""
+    owner = validate_github_repo_name(arguments.get("owner", ""))
+    repo = validate_github_repo_name(arguments.get("repo", ""))
+    merge_method = arguments.get("merge_method", "squash")
+
+    results = await asyncio.to_thread(auto_merge_prs, owner, repo, merge_method=merge_method)
+
+    # Format output
+    parts = [
+        f"# Auto-Merge Results: {owner}/{repo}\n\n",
+        f"**Total PRs Processed:** {results['total_prs']}\n",
+        f"**Merge Method:** {results['merge_method']}\n",
+        f"**Successful Merges:** {results['successful_merges']}\n",
+        f"**Failed Merges:** {results['failed_merges']}\n",
+        f"**Skipped Drafts:** {results['skipped_drafts']}\n\n",
+    ]
+
+    if results.get('stopped_early'):
+        parts.append(f"⚠️ **Stopped Early:** {results['stop_reason']}\n\n")
+
+    parts.append("## Detailed Results\n\n")
+    for result in results['results']:
+        status = "✓" if result['success'] else "✗"
+        parts.append(f"{status} **PR #{result['pr_number']}:** {result['pr_title']}\n")
+        parts.append(f"   - **Author:** {result['pr_author']}\n")
+        
+        if result['success']:
+            parts.append("   - **Status:** Merged successfully\n")
+            if 'sha' in result:
+                parts.append(f"   - **Commit SHA:** {result['sha'][:7]}\n")
         else:
+            parts.append(f"   - **Status:** {result['reason']}\n")
+            parts.append(f"   - **Message:** {result['message']}\n")
+        
+        parts.append("\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_github_default_branch_commands(arguments: Any) -> List[TextContent]:
+    """Handle the github_default_branch_commands tool"""
+    owner = validate_github_repo_name(arguments.get("owner", ""))
+    repo = validate_github_repo_name(arguments.get("repo", ""))
+    new_default = validate_branch_name(arguments.get("new_default", ""))
+
+    commands = generate_default_branch_commands(owner, repo, new_default)
+
+    # Format output
+    parts = [
+        f"# Change Default Branch: {owner}/{repo} → {new_default}\n\n",
+        f"**Note:** {commands['note']}\n\n",
+    ]
+
+    parts.append("## Using GitHub CLI (gh)\n\n")
+    parts.append("```bash\n")
+    parts.append(commands['commands']['gh_cli'])
+    parts.append("\n```\n\n")
+
+    parts.append("## Using curl\n\n")
+    parts.append("```bash\n")
+    parts.append(commands['commands']['curl'])
+    parts.append("\n```\n\n")
+
+    parts.append("## Using Web UI\n\n")
+    parts.append(commands['commands']['web_ui'])
+    parts.append("\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+async def _handle_nl_to_comptext(arguments: Any) -> List[TextContent]:
+    """Handle the nl_to_comptext tool"""
+    from .compiler.nl_to_comptext import compile_nl_to_comptext
+    result = compile_nl_to_comptext(
+        text=arguments.get("text", ""),
+        audience=arguments.get("audience", "dev"),
+        mode=arguments.get("mode", "bundle_only"),
+        return_mode=arguments.get("return", "dsl_plus_confidence"),
+    )
+    return [TextContent(type="text", text=result)]
+
+
+# Tools that change external state; batch_execute runs calls concurrently, so these are rejected there
+_MUTATING_TOOLS = frozenset({"github_auto_merge"})
+
+
+async def _handle_batch_execute(arguments: Any) -> List[TextContent]:
+    """Handle the batch_execute tool"""
+    calls = arguments.get("calls")
+    if not isinstance(calls, list) or not calls:
+        raise ValueError("calls must be a non-empty list")
+    if len(calls) > MAX_BATCH_CALLS:
+        raise ValueError(f"At most {MAX_BATCH_CALLS} calls per batch")
+    for call in calls:
+        if not isinstance(call, dict) or not isinstance(call.get("name"), str):
+            raise ValueError("Each call needs a tool name")
+        if call["name"] == "batch_execute":
+            raise ValueError("batch_execute cannot be nested")
+        if call["name"] in _MUTATING_TOOLS:
+            raise ValueError(f"{call['name']} changes repository state and cannot run in a batch")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_CALLS)
+
+    async def run(call: Dict[str, Any]) -> Sequence[TextContent]:
+        async with semaphore:
+            return await _run_tool(call["name"], call.get("arguments") or {})
+
+    # _run_tool turns failures into error text, so one failing call does not abort the batch
+    results = await asyncio.gather(*(run(call) for call in calls))
+
+    parts = [f"# Batch: {len(calls)} Aufrufe\n\n"]
+    for index, (call, contents) in enumerate(zip(calls, results), start=1):
+        parts.append(f"## {index}. {call['name']}\n\n")
+        for content in contents:
+            parts.append(content.text)
+        parts.append("\n\n")
+
+    return [TextContent(type="text", text="".join(parts))]
+
+
+# Tool name -> handler, resolved with one dict lookup per call
+_HANDLERS: Dict[str, Callable[[Any], Awaitable[List[TextContent]]]] = {
+    "list_modules": _handle_list_modules,
+    "get_module": _handle_get_module,
+    "get_command": _handle_get_command,
+    "search": _handle_search,
+    "get_by_tag": _handle_get_by_tag,
+    "get_by_type": _handle_get_by_type,
+    "get_statistics": _handle_get_statistics,
+    "github_audit": _handle_github_audit,
+    "github_auto_merge": _handle_github_auto_merge,
+    "github_default_branch_commands": _handle_github_default_branch_commands,
+    "nl_to_comptext": _handle_nl_to_comptext,
+    "batch_execute": _handle_batch_execute,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    """Handle tool calls"""
+    return await _run_tool(name, arguments)
+
+
+async def _run_tool(name: str, arguments: Any) -> Sequence[TextContent]:
+    """Dispatch a tool call, reporting failures as error text"""
+    client_error = _settings().client_error
+    try:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
 
     except GitHubClientError as e:
         logger.error(f"GitHub client error: {e}")
         return [TextContent(type="text", text=f"GitHub Error: {str(e)}")]
-    except CodexClientError as e:
+    except client_error as e:
         logger.error(f"Codex client error: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
     except ValueError as e:
@@ -491,6 +611,7 @@ async def main():
     """Run the MCP server"""
     from mcp.server.stdio import stdio_server
 
+    _settings()
     async with stdio_server() as (read_stream, write_stream):
         logger.info("CompText MCP Server starting...")
         await server.run(read_stream, write_stream, server.create_initialization_options())
@@ -0,0 +1,70 @@
+"""Tests for the batch_execute MCP tool"""
+
+import asyncio
+
+import pytest
+
+server = pytest.importorskip("comptext_mcp.server")
+
+from comptext_mcp.constants import MAX_BATCH_CALLS, MAX_CONCURRENT_BATCH_CALLS  # noqa: E402
+
+
+def batch(calls):
+    (content,) = asyncio.run(server.call_tool("batch_execute", {"calls": calls}))
+    return content.text
+
+
+@pytest.mark.parametrize(
+    "calls, error",
+    [
+        ([], "calls must be a non-empty list"),
+        (None, "calls must be a non-empty list"),
+        ([{"name": "list_modules"}] * (MAX_BATCH_CALLS + 1), f"At most {MAX_BATCH_CALLS} calls per batch"),
+        ([{"arguments": {}}], "Each call needs a tool name"),
+        (["list_modules"], "Each call needs a tool name"),
+        ([{"name": "batch_execute", "arguments": {"calls": []}}], "batch_execute cannot be nested"),
+        ([{"name": "github_auto_merge", "arguments": {"owner": "o", "repo": "r"}}], "cannot run in a batch"),
+    ],
+)
+def test_rejects_invalid_batches(calls, error):
+    text = batch(calls)
+    assert text.startswith("Validation error:")
+    assert error in text
+
+
+def test_results_keep_request_order_and_isolate_failures(monkeypatch):
+    async def echo(arguments):
+        await asyncio.sleep(arguments["delay"])
+        return [server.TextContent(type="text", text=arguments["text"])]
+
+    monkeypatch.setitem(server._HANDLERS, "echo", echo)
+
+    text = batch(
+        [
+            {"name": "echo", "arguments": {"text": "slow", "delay": 0.02}},
+            {"name": "unknown_tool"},
+            {"name": "echo", "arguments": {"text": "fast", "delay": 0}},
+        ]
+    )
+
+    assert text.index("## 1. echo\n\nslow") < text.index("## 2. unknown_tool") < text.index("## 3. echo\n\nfast")
+    assert "Unknown tool: unknown_tool" in text
+
+
+def test_concurrency_is_capped(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def probe(arguments):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return [server.TextContent(type="text", text="ok")]
+
+    monkeypatch.setitem(server._HANDLERS, "probe", probe)
+
+    batch([{"name": "probe"}] * MAX_BATCH_CALLS)
+
+    assert peak == MAX_CONCURRENT_BATCH_CALLS
@@ -0,0 +1,43 @@
+"""Tests for the mobile agent MCP tool wrappers"""
+
+import asyncio
+import json
+
+import pytest
+
+from comptext_mcp.mobile_agent.tools import mcp_tools
+
+
+class FakeServer:
+    """Collects the functions registered through server.tool(name)"""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, name):
+        def register(func):
+            self.tools[name] = func
+            return func
+
+        return register
+
+
+@pytest.fixture
+def tools(monkeypatch):
+    async def no_device():
+        raise AssertionError("invalid input must not connect to the device")
+
+    monkeypatch.setattr(mcp_tools, "_get_device", no_device)
+    server = FakeServer()
+    mcp_tools.register_mobile_tools(server)
+    return server.tools
+
+
+def test_swipe_without_direction(tools):
+    assert asyncio.run(tools["mobile_swipe"]()) == mcp_tools._ERR_SWIPE_MISSING
+
+
+def test_swipe_with_invalid_direction(tools):
+    result = json.loads(asyncio.run(tools["mobile_swipe"]("sideways")))
+
+    assert result == {"success": False, "error": "Invalid direction: sideways"}
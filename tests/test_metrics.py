@@ -0,0 +1,86 @@
+"""Tests for mobile agent token metrics"""
+
+import csv
+from datetime import datetime, timedelta
+
+from comptext_mcp.mobile_agent.utils.metrics import TokenMetricsCollector
+
+
+def run_task(collector, task_id, steps, success=True):
+    collector.start_task(task_id, f"task {task_id}")
+    for prompt, completion, duration, ok, baseline in steps:
+        collector.record_step(prompt, completion, duration, ok, baseline_tokens=baseline)
+    collector.complete_task(success, error=None if success else "failed")
+
+
+def test_task_timestamps_are_set():
+    collector = TokenMetricsCollector()
+    task = collector.start_task("t1", "open settings")
+
+    assert isinstance(task.started_at, datetime)
+    assert task.completed_at is None
+
+    collector.complete_task(True)
+
+    assert task.started_at <= task.completed_at
+    assert abs(datetime.now() - task.completed_at) < timedelta(seconds=5)
+
+
+def test_aggregates_match_after_rebuild():
+    collector = TokenMetricsCollector()
+    run_task(collector, "a", [(100, 20, 200.0, True, 400), (50, 10, 100.0, False, 200)])
+    run_task(collector, "b", [(30, 5, 50.0, True, None)], success=False)
+    run_task(collector, "c", [(10, 10, 10.0, True, 40)])
+    incremental = collector.get_performance_metrics()
+
+    collector.rebuild_aggregates()
+    assert collector.get_performance_metrics() == incremental
+
+    assert incremental.total_tasks == 3
+    assert incremental.successful_tasks == 2
+    assert incremental.failed_tasks == 1
+    assert incremental.total_tokens == 235
+    assert incremental.total_prompt_tokens == 190
+    assert incremental.total_baseline_tokens == 640
+    assert incremental.total_comptext_tokens == 160
+    assert incremental.total_steps == 4
+    assert incremental.successful_steps == 3
+    assert incremental.avg_step_duration_ms == 90.0
+    assert incremental.step_success_rate == 75.0
+    assert incremental.avg_token_reduction_percent == 75.0
+
+
+def test_rebuild_reflects_removed_tasks():
+    collector = TokenMetricsCollector()
+    run_task(collector, "a", [(100, 20, 200.0, True, None)])
+    run_task(collector, "b", [(30, 5, 50.0, True, None)])
+
+    del collector.tasks[0]
+    collector.rebuild_aggregates()
+    metrics = collector.get_performance_metrics()
+
+    assert metrics.total_tasks == 1
+    assert metrics.total_tokens == 35
+    assert metrics.total_duration_ms == 50.0
+
+
+def test_rebuild_of_empty_collector_gives_zero_metrics():
+    collector = TokenMetricsCollector()
+    run_task(collector, "a", [(1, 1, 1.0, True, None)])
+    collector.tasks.clear()
+    collector.rebuild_aggregates()
+
+    assert collector.get_performance_metrics().total_tasks == 0
+
+
+def test_export_csv_writes_timestamps(tmp_path):
+    collector = TokenMetricsCollector()
+    run_task(collector, "a", [(100, 20, 200.0, True, None)])
+    path = tmp_path / "metrics.csv"
+
+    collector.export_csv(str(path))
+
+    with open(path, newline="") as f:
+        (row,) = csv.DictReader(f)
+    assert row["started_at"] == collector.tasks[0].started_at.isoformat()
+    assert row["completed_at"] == collector.tasks[0].completed_at.isoformat()
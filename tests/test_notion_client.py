@@ -0,0 +1,302 @@
+"""Tests for the Notion codex client, run against an in-memory stand-in for the SDK"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from notion_client.errors import APIResponseError
+
+from comptext_mcp import notion_client
+
+
+def make_page(i, title, tags=("Core",), typ="Beispiel", modul="Modul A: Allgemeine Befehle"):
+    return {
+        "id": f"page-{i}",
+        "url": f"https://notion.so/page-{i}",
+        "created_time": "2024-01-01T00:00:00.000Z",
+        "last_edited_time": "2024-01-01T00:00:00.000Z",
+        "properties": {
+            "Titel": {"title": [{"plain_text": title}]},
+            "Beschreibung": {"rich_text": [{"plain_text": f"Beschreibung {title}"}]},
+            "Modul": {"select": {"name": modul}},
+            "Typ": {"select": {"name": typ}},
+            "Tags": {"multi_select": [{"name": tag} for tag in tags]},
+        },
+    }
+
+
+def api_error(status, code="validation_error"):
+    return APIResponseError(code, status, "rejected", httpx.Headers(), "{}")
+
+
+class FakeNotion:
+    """Answers databases.query from a page list, failing with the queued errors first"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+        self.page_sizes = []
+        self.errors = []
+        self.databases = SimpleNamespace(query=self.query)
+
+    def query(self, database_id, page_size, filter=None, start_cursor=None):
+        self.queries.append(filter)
+        self.page_sizes.append(page_size)
+        if self.errors:
+            raise self.errors.pop(0)
+        pages = [page for page in self.pages if filter is None or self.matches(page, filter)]
+        start = int(start_cursor or 0)
+        results = pages[start : start + page_size]
+        has_more = start + page_size < len(pages)
+        return {"results": results, "has_more": has_more, "next_cursor": str(start + page_size) if has_more else None}
+
+    @classmethod
+    def matches(cls, page, filter):
+        if "or" in filter:
+            return any(cls.matches(page, clause) for clause in filter["or"])
+        prop = page["properties"][filter["property"]]
+        if "select" in filter:
+            return prop["select"]["name"] == filter["select"]["equals"]
+        if "multi_select" in filter:
+            # Notion matches whole options, not substrings of them
+            return any(option["name"] == filter["multi_select"]["contains"] for option in prop["multi_select"])
+        (kind,) = {"title", "rich_text"} & filter.keys()
+        text = "".join(part["plain_text"] for part in prop[kind])
+        return filter[kind]["contains"].lower() in text.lower()
+
+
+@pytest.fixture
+def fake_notion(monkeypatch):
+    pages = [
+        make_page(0, "Befehlsübersicht", tags=("Core", "Erweitert")),
+        make_page(1, "Python Beispiele", tags=("Programmierung",), typ="Dokumentation"),
+        make_page(2, "Core Konzepte", tags=("Grundlagen",)),
+    ]
+    fake = FakeNotion(pages)
+    monkeypatch.setattr(notion_client, "notion", fake)
+    monkeypatch.setattr(notion_client, "RETRY_DELAY", 0)
+    notion_client.clear_cache()
+    yield fake
+    notion_client.clear_cache()
+
+
+def titles(modules):
+    return [module["titel"] for module in modules]
+
+
+def test_cold_search_sends_one_filtered_query(fake_notion):
+    results = asyncio.run(notion_client.search_codex("Konzepte", max_results=5))
+
+    assert titles(results) == ["Core Konzepte"]
+    (search_filter,) = fake_notion.queries
+    assert [clause["property"] for clause in search_filter["or"]] == ["Titel", "Beschreibung", "Tags"]
+    assert fake_notion.page_sizes == [5]
+    assert notion_client._modules_cache is None
+
+
+def test_warm_search_scans_the_cache(fake_notion):
+    asyncio.run(notion_client.get_all_modules())
+
+    results = asyncio.run(notion_client.search_codex("core"))
+
+    # Substring match on title and joined tags, in database order
+    assert titles(results) == ["Befehlsübersicht", "Core Konzepte"]
+    assert fake_notion.queries == [None]
+
+
+def test_cold_search_matches_tags_exactly(fake_notion):
+    assert titles(asyncio.run(notion_client.search_codex("Programmierung"))) == ["Python Beispiele"]
+    assert asyncio.run(notion_client.search_codex("Programm")) == []
+
+    asyncio.run(notion_client.get_all_modules())
+    assert titles(asyncio.run(notion_client.search_codex("Programm"))) == ["Python Beispiele"]
+
+
+def test_rejected_search_filter_falls_back_to_scanning(fake_notion):
+    fake_notion.errors = [api_error(400)]
+
+    results = asyncio.run(notion_client.search_codex("core"))
+
+    # The rejected filter is not retried; the full load follows right away
+    assert titles(results) == ["Befehlsübersicht", "Core Konzepte"]
+    assert len(fake_notion.queries) == 2 and fake_notion.queries[1] is None
+
+
+def test_search_skips_entries_with_shorter_fields(fake_notion, monkeypatch):
+    probed = []
+
+    class ProbedBlob(str):
+        def __contains__(self, query):
+            probed.append(self)
+            return super().__contains__(query)
+
+    fake_notion.pages = [make_page(0, "ab", tags=("b",)), make_page(1, "ab ab ab ab ab ab ab ab", tags=("a",))]
+    asyncio.run(notion_client.get_all_modules())
+    monkeypatch.setattr(notion_client, "_search_blob", [ProbedBlob(blob) for blob in notion_client._search_blob])
+
+    # Both entries hold every character of the query, but only the second has a field as long
+    results = asyncio.run(notion_client.search_codex("ab ab ab ab ab ab ab"))
+
+    assert titles(results) == ["ab ab ab ab ab ab ab ab"]
+    assert probed == [notion_client._search_blob[1]]
+
+
+def test_search_respects_max_results(fake_notion):
+    assert titles(asyncio.run(notion_client.search_codex("beschreibung", max_results=2))) == [
+        "Befehlsübersicht",
+        "Python Beispiele",
+    ]
+    asyncio.run(notion_client.get_all_modules())
+    assert titles(asyncio.run(notion_client.search_codex("beschreibung", max_results=1))) == ["Befehlsübersicht"]
+    assert asyncio.run(notion_client.search_codex("core", max_results=0)) == []
+
+
+def test_client_errors_are_not_retried(fake_notion):
+    fake_notion.errors = [api_error(400), api_error(400)]
+
+    with pytest.raises(notion_client.NotionClientError, match=r"Request rejected \(400\)"):
+        asyncio.run(notion_client.get_modules_by_type("Beispiel"))
+    assert len(fake_notion.queries) == 1
+
+
+def test_rate_limits_are_retried(fake_notion):
+    fake_notion.errors = [api_error(429, "rate_limited")]
+
+    modules = asyncio.run(notion_client.get_modules_by_type("Beispiel"))
+
+    assert titles(modules) == ["Befehlsübersicht", "Core Konzepte"]
+    assert len(fake_notion.queries) == 2
+
+
+def test_server_errors_give_up_after_max_retries(fake_notion):
+    fake_notion.errors = [api_error(502, "internal_server_error")] * notion_client.MAX_RETRIES
+
+    with pytest.raises(notion_client.NotionClientError, match="Failed after"):
+        asyncio.run(notion_client.get_modules_by_type("Beispiel"))
+    assert len(fake_notion.queries) == notion_client.MAX_RETRIES
+
+
+def test_concurrent_identical_queries_share_one_request(fake_notion):
+    modul = "Modul A: Allgemeine Befehle"
+
+    async def main():
+        return await asyncio.gather(
+            *(notion_client.get_module_by_name(modul) for _ in range(5)),
+            notion_client.get_modules_by_type("Dokumentation"),
+        )
+
+    *same, other = asyncio.run(main())
+
+    assert all(result is same[0] for result in same)
+    assert len(same[0]) == 3 and titles(other) == ["Python Beispiele"]
+    assert len(fake_notion.queries) == 2
+
+
+def test_query_results_are_cached_until_cleared(fake_notion):
+    asyncio.run(notion_client.get_modules_by_tag("Core"))
+    asyncio.run(notion_client.get_modules_by_tag("Core"))
+    assert len(fake_notion.queries) == 1
+
+    notion_client.clear_cache()
+    asyncio.run(notion_client.get_modules_by_tag("Core"))
+    assert len(fake_notion.queries) == 2
+
+
+def test_multi_filter_queries_run_concurrently_and_merge_by_id(fake_notion, monkeypatch):
+    running = 0
+    peak = 0
+    run_blocking = notion_client._run_blocking
+
+    async def tracked(func, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        try:
+            return await run_blocking(func, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(notion_client, "_run_blocking", tracked)
+
+    results = asyncio.run(notion_client.get_modules_multi(tag="Core", typ="Beispiel"))
+
+    # "Befehlsübersicht" matches both filters and is returned once
+    assert titles(results) == ["Befehlsübersicht", "Core Konzepte"]
+    assert len(fake_notion.queries) == 2
+    assert peak == 2
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """Factory for counting coroutine functions wrapped in a private _ttl_cached"""
+    monkeypatch.setattr(notion_client, "_query_caches", [])
+    calls = []
+
+    def make(**cache_options):
+        @notion_client._ttl_cached(**cache_options)
+        async def lookup(key):
+            calls.append(key)
+            if key == "fail":
+                raise notion_client.NotionClientError("boom")
+            return key.upper()
+
+        return lookup
+
+    return make, calls
+
+
+def test_ttl_cache_evicts_the_oldest_entry(counted):
+    make, calls = counted
+    lookup = make(maxsize=2, ttl=60)
+
+    async def main():
+        for key in ("a", "b", "a", "c", "b", "a"):
+            assert await lookup(key) == key.upper()
+
+    asyncio.run(main())
+
+    # "a" is evicted when "c" arrives and "b" is then the oldest entry
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_ttl_cache_expires_entries(counted):
+    make, calls = counted
+    lookup = make(maxsize=2, ttl=0)
+
+    asyncio.run(lookup("a"))
+    asyncio.run(lookup("a"))
+
+    assert calls == ["a", "a"]
+
+
+def test_ttl_cache_does_not_keep_failures(counted):
+    make, calls = counted
+    lookup = make(maxsize=2, ttl=60)
+
+    for _ in range(2):
+        with pytest.raises(notion_client.NotionClientError):
+            asyncio.run(lookup("fail"))
+
+    assert calls == ["fail", "fail"]
+
+
+def test_single_flight_survives_a_cancelled_caller():
+    calls = []
+
+    @notion_client._single_flight
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    async def main():
+        first = asyncio.ensure_future(fetch("x"))
+        second = asyncio.ensure_future(fetch("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "x"
+    assert calls == ["x"]
@@ -0,0 +1,47 @@
+"""Tests for the lazily resolved package exports"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def run_python(code, cwd=None):
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run([sys.executable, "-c", code], env=env, cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_client_exports_do_not_load_the_server():
+    code = "import sys, comptext_mcp; comptext_mcp.local_search_codex; print('comptext_mcp.server' in sys.modules)"
+
+    assert run_python(code) == ["False"]
+
+
+def test_importing_the_server_defers_settings(tmp_path):
+    (tmp_path / ".env").write_text("COMPTEXT_ENV_PROBE=loaded\n")
+    code = (
+        "import os, sys, comptext_mcp.server as module; "
+        "print('comptext_mcp.local_codex_client' in sys.modules, os.getenv('COMPTEXT_ENV_PROBE')); "
+        "module._settings(); "
+        "print('comptext_mcp.local_codex_client' in sys.modules, os.getenv('COMPTEXT_ENV_PROBE'))"
+    )
+
+    assert run_python(code, cwd=tmp_path) == ["False", "None", "True", "loaded"]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "from comptext_mcp import server",
+        "from comptext_mcp import main; from comptext_mcp import server",
+    ],
+)
+def test_server_export_is_the_server_instance(code):
+    assert run_python(f"{code}; print(type(server).__name__)") == ["Server"]
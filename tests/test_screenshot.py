@@ -0,0 +1,35 @@
+"""Tests for the screenshot pipeline history"""
+
+import pytest
+
+from comptext_mcp.mobile_agent.utils.screenshot import ScreenshotPipeline, ScreenshotResult
+
+
+def add_screenshots(pipeline, tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"shot_{i}.png"
+        path.write_bytes(b"png")
+        pipeline._add_to_history(ScreenshotResult(success=True, path=str(path)))
+        paths.append(path)
+    return paths
+
+
+def test_history_keeps_the_newest_screenshots(tmp_path):
+    pipeline = ScreenshotPipeline(output_dir=str(tmp_path), max_history=2)
+
+    paths = add_screenshots(pipeline, tmp_path, 3)
+
+    assert [result.path for result in pipeline.history] == [str(paths[1]), str(paths[2])]
+    assert [path.exists() for path in paths] == [False, True, True]
+
+
+@pytest.mark.parametrize("max_history", [0, -1])
+def test_history_without_room_removes_each_screenshot(tmp_path, max_history):
+    pipeline = ScreenshotPipeline(output_dir=str(tmp_path), max_history=max_history)
+
+    paths = add_screenshots(pipeline, tmp_path, 2)
+
+    assert pipeline.history == []
+    assert pipeline.get_latest() is None
+    assert not any(path.exists() for path in paths)
@@ -0,0 +1,110 @@
+"""Tests for the Android UI hierarchy parser
+
+Expected outputs were produced by the original regex and ElementTree based parser.
+"""
+
+import pytest
+
+from comptext_mcp.mobile_agent.utils.ui_parser import EXAMPLE_UI_XML, UINode, UITreeParser, _parse_bounds, parse_ui_dump
+
+
+@pytest.mark.parametrize(
+    "bounds, expected",
+    [
+        ("[0,0][1080,1920]", (0, 0, 1080, 1920)),
+        ("[120,800][280,1000]", (120, 800, 280, 1000)),
+        ("[1,2][3,4]trailing", (1, 2, 3, 4)),
+        ("[1,2][3,4][5,6]", (1, 2, 3, 4)),
+        ("[-10,0][100,100]", (0, 0, 0, 0)),
+        ("[ 1,2][300,400]", (0, 0, 0, 0)),
+        ("[1_0,0][300,400]", (0, 0, 0, 0)),
+        ("[1,2,3][4,5]", (0, 0, 0, 0)),
+        ("[1,2]x[3,4]", (0, 0, 0, 0)),
+        ("1,2][3,4]", (0, 0, 0, 0)),
+        ("", (0, 0, 0, 0)),
+    ],
+)
+def test_parse_bounds_matches_the_bounds_regex(bounds, expected):
+    assert _parse_bounds(bounds) == expected
+
+
+@pytest.mark.parametrize(
+    "class_name, clickable, expected",
+    [
+        ("android.widget.Button", False, "B"),
+        ("android.widget.ToggleButton", False, "B"),
+        ("android.widget.EditText", False, "I"),
+        ("android.widget.AutoCompleteTextView", False, "T"),
+        ("android.widget.CheckBox", False, "C"),
+        ("android.widget.Switch", False, "S"),
+        ("android.widget.ImageView", False, "G"),
+        ("android.widget.TextView", False, "T"),
+        ("androidx.recyclerview.widget.RecyclerView", False, "L"),
+        ("androidx.core.widget.NestedScrollView", False, "R"),
+        ("android.widget.FrameLayout", True, "K"),
+        ("android.view.View", False, "E"),
+        # Keywords anywhere in the class name count, package path included
+        ("com.example.imagepicker.TextView", False, "G"),
+        ("com.example.scroll.View", False, "R"),
+        ("com.example.ButtonBar.LinearLayout", False, "B"),
+        ("com.google.android.material.textfield.TextInputLayout", False, "I"),
+        ("", True, "K"),
+    ],
+)
+def test_element_type(class_name, clickable, expected):
+    assert UINode(index=0, class_name=class_name, clickable=clickable).element_type == expected
+
+
+SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<hierarchy rotation="0">
+  <node class="android.widget.FrameLayout" enabled="true" bounds="[0,0][1080,1920]">
+    <node text="OK" class="android.widget.Button" clickable="true" enabled="true" bounds="[100,1500][400,1600]" />
+    <node text="Disabled" class="android.widget.Button" clickable="true" enabled="false" bounds="[500,1500][800,1600]" />
+    <node text="No enabled attribute" class="android.widget.TextView" bounds="[0,100][1080,200]" />
+    <node text="Tiny" class="android.widget.TextView" enabled="true" bounds="[0,0][5,5]" />
+    <node class="android.widget.LinearLayout" enabled="true" bounds="[0,300][1080,400]" />
+    <node class="android.widget.ScrollView" scrollable="true" enabled="true" bounds="[0,400][1080,1400]">
+      <node content-desc="Avatar" class="android.widget.ImageView" enabled="true" bounds="[20,420][120,520]" />
+      <node resource-id="com.example:id/agree" class="android.widget.CheckBox" checkable="true" checked="true"
+            enabled="true" bounds="[20,600][120,700]" />
+    </node>
+    <node text="Offscreen" class="android.widget.TextView" enabled="true" bounds="[-200,0][-100,100]" />
+  </node>
+</hierarchy>"""
+
+
+def test_parse_filters_and_ranks_nodes():
+    nodes = UITreeParser().parse(SAMPLE_XML)
+
+    # Disabled, tiny, offscreen and empty non-interactive nodes are dropped
+    assert [node.to_comptext() for node in nodes] == [
+        "0:B:OK@250,1550",
+        "1:R:ScrollView@540,900",
+        "2:C:agree@70,650",
+        "3:T:No enabled attribute@540,150",
+        "4:G:Avatar@70,470",
+    ]
+    assert [(node.checked, node.enabled, node.bounds) for node in nodes] == [
+        (False, True, (100, 1500, 400, 1600)),
+        (False, True, (0, 400, 1080, 1400)),
+        (True, True, (20, 600, 120, 700)),
+        (False, True, (0, 100, 1080, 200)),
+        (False, True, (20, 420, 120, 520)),
+    ]
+
+
+def test_parse_keeps_the_most_relevant_nodes():
+    nodes = UITreeParser(max_elements=2).parse(SAMPLE_XML)
+
+    assert [(node.index, node.display_name) for node in nodes] == [(0, "OK"), (1, "ScrollView")]
+
+
+def test_parse_ui_dump_example():
+    nodes, formatted = parse_ui_dump(EXAMPLE_UI_XML)
+
+    assert formatted == "Els:\n0:T:Chrome@200,900\n1:T:Settings@480,900\n2:T:Messages@760,900"
+    assert nodes[0].to_dict()["resource_id"] == "com.android.launcher3:id/icon"
+
+
+def test_parse_invalid_xml():
+    assert UITreeParser().parse("<hierarchy><node") == []
@@ -0,0 +1,132 @@
+"""Tests for the event stream of the WebSocket mobile agent"""
+
+import asyncio
+import json
+
+from comptext_mcp.mobile_agent.config import MobileAgentConfig
+from comptext_mcp.mobile_agent.droidrun_wrapper import ActionResult, ActionType, ScreenState
+from comptext_mcp.mobile_agent.ollama_client import ChatMessage, ChatResponse
+from comptext_mcp.mobile_agent.websocket_server import EventType, WebSocketMobileAgent
+
+DONE = json.dumps({"thought": "finished", "action": "done"})
+BACK = json.dumps({"thought": "go back", "action": "back"})
+
+
+class FakeOllama:
+    def __init__(self, replies, tokens=10):
+        self._replies = list(replies)
+        self._tokens = tokens
+
+    async def chat(self, messages):
+        return ChatResponse(
+            message=ChatMessage(role="assistant", content=self._replies.pop(0)),
+            model="fake",
+            total_tokens=self._tokens,
+            prompt_tokens=self._tokens // 2,
+            completion_tokens=self._tokens // 2,
+            finish_reason="stop",
+        )
+
+
+class FakeDevice:
+    async def get_screen_state(self):
+        return ScreenState(package="com.example", activity=".Main")
+
+    async def back(self):
+        return ActionResult(success=True, action=ActionType.BACK, message="Back pressed")
+
+
+def run_agent(replies):
+    """Run a task against fake LLM replies and return the broadcast (type, data) pairs"""
+    config = MobileAgentConfig()
+    config.agent.step_delay = 0
+    events = []
+    agent = WebSocketMobileAgent(config, broadcast_callback=events.append)
+    agent.ollama = FakeOllama(replies)
+    agent.device = FakeDevice()
+    result = asyncio.run(agent.execute("open settings"))
+    return result, [(event.type, event.data) for event in events]
+
+
+def step_completed(events):
+    """STEP_COMPLETED payloads with the wall-clock duration checked and removed"""
+    payloads = []
+    for event_type, data in events:
+        if event_type == EventType.STEP_COMPLETED:
+            data = dict(data)
+            assert data.pop("duration_ms") >= 0
+            payloads.append(data)
+    return payloads
+
+
+def test_done_step_reports_telemetry_in_step_completed():
+    result, events = run_agent([DONE])
+
+    assert result.success
+    assert [event_type for event_type, _ in events] == [
+        EventType.TASK_STARTED,
+        EventType.SCREEN_UPDATED,
+        EventType.STEP_STARTED,
+        EventType.STATE_CHANGED,
+        EventType.STATE_CHANGED,
+        EventType.STEP_COMPLETED,
+        EventType.TASK_COMPLETED,
+    ]
+    assert events[4][1] == {"state": "completed"}
+    assert step_completed(events) == [
+        {
+            "step": 1,
+            "action": "done",
+            "success": True,
+            "progress": 10.0,
+            "max_steps": 10,
+            "step_tokens": 10,
+            "total_tokens": 10,
+        }
+    ]
+
+
+def test_parse_failure_step_still_reports_telemetry():
+    result, events = run_agent(["no json here", DONE])
+
+    assert result.success
+    assert [event_type for event_type, _ in events] == [
+        EventType.TASK_STARTED,
+        EventType.SCREEN_UPDATED,
+        EventType.STEP_STARTED,
+        EventType.STATE_CHANGED,
+        EventType.STEP_COMPLETED,
+        EventType.STEP_STARTED,
+        EventType.STATE_CHANGED,
+        EventType.STEP_COMPLETED,
+        EventType.TASK_COMPLETED,
+    ]
+    failed, done = step_completed(events)
+    assert failed == {
+        "step": 1,
+        "action": None,
+        "success": False,
+        "progress": 10.0,
+        "max_steps": 10,
+        "step_tokens": 10,
+        "total_tokens": 10,
+    }
+    assert (done["step"], done["action"], done["total_tokens"]) == (2, "done", 20)
+
+
+def test_executed_step_reports_telemetry_in_step_completed():
+    result, events = run_agent([BACK, DONE])
+
+    assert result.success
+    types = [event_type for event_type, _ in events]
+    assert EventType.TOKENS_USED not in types and EventType.PROGRESS_UPDATE not in types
+    assert types.index(EventType.ACTION_EXECUTED) < types.index(EventType.STEP_COMPLETED)
+    assert step_completed(events)[0] == {
+        "step": 1,
+        "action": "back",
+        "success": True,
+        "progress": 10.0,
+        "max_steps": 10,
+        "step_tokens": 10,
+        "total_tokens": 10,
+    }
@@ -0,0 +1,130 @@
+"""Tests for screenshot broadcasts of the WebSocket server"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("websockets")
+
+from comptext_mcp.mobile_agent import droidrun_wrapper  # noqa: E402
+from comptext_mcp.mobile_agent.config import MobileAgentConfig  # noqa: E402
+from comptext_mcp.mobile_agent.websocket_server import (  # noqa: E402
+    EventType,
+    MobileAgentWebSocketServer,
+    WebSocketEvent,
+)
+
+PNG = b"\x89PNG\r\n\x1a\nfake"
+
+
+class FakeClient:
+    """Stands in for a connected websocket; only identity matters to the broadcaster"""
+
+
+def make_server(monkeypatch, screenshot_path):
+    class FakeDevice:
+        def __init__(self, config):
+            pass
+
+        async def connect(self):
+            return True
+
+        async def screenshot(self):
+            return screenshot_path
+
+    monkeypatch.setattr(droidrun_wrapper, "DroidRunWrapper", FakeDevice)
+    server = MobileAgentWebSocketServer(config=MobileAgentConfig())
+    plain, binary = FakeClient(), FakeClient()
+    server._client_queues = {plain: asyncio.Queue(), binary: asyncio.Queue()}
+    server._binary_clients.add(binary)
+    return server, plain, binary
+
+
+def sent_frames(server, client):
+    queue = server._client_queues[client]
+    return [frame for _ in range(queue.qsize()) for frame in queue.get_nowait()]
+
+
+def test_binary_frame_only_goes_to_clients_that_opted_in(monkeypatch, tmp_path):
+    path = tmp_path / "screen.png"
+    path.write_bytes(PNG)
+    server, plain, binary = make_server(monkeypatch, str(path))
+
+    asyncio.run(server._capture_screenshot())
+
+    (message,) = sent_frames(server, plain)
+    assert json.loads(message)["data"] == {"screenshot_path": str(path)}
+
+    header, payload = sent_frames(server, binary)
+    assert json.loads(header)["data"] == {"screenshot_path": str(path), "binary": "image/png", "size": len(PNG)}
+    assert payload == PNG
+
+
+def test_unreadable_screenshot_falls_back_to_json(monkeypatch, tmp_path):
+    missing = str(tmp_path / "missing.png")
+    server, plain, binary = make_server(monkeypatch, missing)
+
+    asyncio.run(server._capture_screenshot())
+
+    for client in (plain, binary):
+        (message,) = sent_frames(server, client)
+        assert json.loads(message)["data"] == {"screenshot_path": missing}
+
+
+def test_missing_screenshot_path_broadcasts_nothing(monkeypatch):
+    server, plain, binary = make_server(monkeypatch, None)
+
+    asyncio.run(server._capture_screenshot())
+
+    assert sent_frames(server, plain) == []
+    assert sent_frames(server, binary) == []
+
+
+def test_direct_messages_queue_behind_broadcasts(monkeypatch):
+    server, plain, _ = make_server(monkeypatch, None)
+
+    async def scenario():
+        await server._broadcast(WebSocketEvent(type=EventType.STEP_STARTED, data={"step": 1}))
+        await server._send_status(plain)
+
+    asyncio.run(scenario())
+
+    types = [json.loads(frame)["type"] for frame in sent_frames(server, plain)]
+    assert types == ["step_started", "progress_update"]
+
+
+def test_writer_sends_welcome_before_later_broadcasts():
+    server = MobileAgentWebSocketServer(config=MobileAgentConfig())
+    sent = []
+
+    class FakeSocket:
+        def __init__(self):
+            self.messages = asyncio.Queue()
+
+        async def send(self, frame):
+            sent.append(json.loads(frame)["type"])
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            message = await self.messages.get()
+            if message is None:
+                raise StopAsyncIteration
+            return message
+
+    async def scenario():
+        websocket = FakeSocket()
+        handler = asyncio.create_task(server._handler(websocket))
+        await asyncio.sleep(0)
+        await server._broadcast(WebSocketEvent(type=EventType.TASK_STARTED))
+        await websocket.messages.put(json.dumps({"command": "status"}))
+        while len(sent) < 3:
+            await asyncio.sleep(0)
+        await websocket.messages.put(None)
+        await handler
+
+    asyncio.run(scenario())
+
+    assert sent == ["connected", "task_started", "progress_update"]